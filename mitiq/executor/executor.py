@@ -10,6 +10,7 @@ import collections
 import inspect
 import warnings
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
     Any,
     Callable,
@@ -61,6 +62,21 @@ MeasurementResultLike = [
     list[MeasurementResult],
     tuple[MeasurementResult],
 ]
+# Return annotations which identify a batched executor. Built once at import
+# so that ``Executor.can_batch`` is a plain membership test.
+_BATCHED_RETURN_TYPES = tuple(
+    BatchedType[T]  # type: ignore[index]
+    for BatchedType in [
+        Iterable,
+        List,
+        Sequence,
+        Tuple,
+        list,
+        tuple,
+        collections.abc.Sequence,
+    ]
+    for T in get_args(QuantumResult)
+)
 
 
 class Executor:
@@ -73,18 +89,30 @@ class Executor:
             outputs a sequence of ``mitiq.QuantumResult`` s.
         max_batch_size: Maximum number of programs that can be sent in a
             single batch (if the executor is batched).
+        max_workers: Maximum number of programs that can be in flight at
+            once (if the executor is serial). Values larger than 1 call the
+            executor from a pool of threads, which can speed up executors
+            that wait on a remote backend. In that case the executor must be
+            thread-safe.
     """
 
     def __init__(
         self,
         executor: Callable[[Union[QPROGRAM, Sequence[QPROGRAM]]], Any],
         max_batch_size: int = 75,
+        max_workers: int = 1,
     ) -> None:
         self._executor = executor
 
-        executor_annotation = inspect.getfullargspec(executor).annotations
+        # Plain functions expose their annotations directly, other callables
+        # (partials, callable objects, ...) need a full signature inspection.
+        if inspect.isfunction(executor):
+            executor_annotation = executor.__annotations__
+        else:
+            executor_annotation = inspect.getfullargspec(executor).annotations
         self._executor_return_type = executor_annotation.get("return")
         self._max_batch_size = max_batch_size
+        self._max_workers = max_workers
 
         self._executed_circuits: List[QPROGRAM] = []
         self._quantum_results: List[QuantumResult] = []
@@ -117,19 +145,7 @@ class Executor:
         if return_type is None:
             return False
 
-        return return_type in (
-            BatchedType[T]  # type: ignore[index]
-            for BatchedType in [
-                Iterable,
-                List,
-                Sequence,
-                Tuple,
-                list,
-                tuple,
-                collections.abc.Sequence,
-            ]
-            for T in get_args(QuantumResult)
-        )
+        return return_type in _BATCHED_RETURN_TYPES
 
     @property
     def executed_circuits(self) -> List[QPROGRAM]:
@@ -310,7 +326,10 @@ class Executor:
                 for circ in collection.keys()
             ]
 
-        if not self.can_batch:
+        if not self.can_batch and self._max_workers > 1:
+            self._call_executor_threaded(to_run, **kwargs)
+
+        elif not self.can_batch:
             for circuit in to_run:
                 self._call_executor(circuit, **kwargs)
 
@@ -358,3 +377,23 @@ class Executor:
         else:
             self._quantum_results.append(result)
             self._executed_circuits.append(to_run)
+
+    def _call_executor_threaded(
+        self, to_run: Sequence[QPROGRAM], **kwargs: Any
+    ) -> None:
+        """Calls the (serial) executor on each input circuit from a pool of
+        at most ``self._max_workers`` threads. Results are stored in the same
+        order as the input circuits.
+
+        Args:
+            to_run: Circuits to run.
+        """
+        with ThreadPoolExecutor(max_workers=self._max_workers) as pool:
+            results = list(
+                pool.map(
+                    lambda circuit: self._executor(circuit, **kwargs), to_run
+                )
+            )
+        self._calls_to_executor += len(to_run)
+        self._quantum_results.extend(results)
+        self._executed_circuits.extend(to_run)
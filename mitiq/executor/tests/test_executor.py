@@ -5,6 +5,7 @@
 
 """Unit tests for Collector."""
 
+from functools import partial
 from random import choices
 from typing import List
 
@@ -104,6 +105,16 @@ def test_executors_can_batch():
     assert Executor(executor_measurements_batched).can_batch
 
 
+def test_executors_can_batch_non_function_callables():
+    class BatchedCallable:
+        def __call__(self, circuits) -> List[float]:
+            return executor_batched(circuits)
+
+    assert Executor(BatchedCallable()).can_batch
+    assert Executor(partial(executor_batched, return_value=1.0)).can_batch
+    assert not Executor(partial(executor_serial_typed)).can_batch
+
+
 def test_executor_non_hermitian_observable():
     obs = Observable(PauliString("Z", coeff=1j))
 
@@ -208,6 +219,22 @@ def test_run_executor_preserves_order(s, b):
     assert np.allclose(collector.run(batch), executor_batched_unique(batch))
 
 
+@pytest.mark.parametrize("force_run_all", (True, False))
+def test_run_executor_serial_threaded(force_run_all):
+    collector = Executor(executor=executor_serial_unique, max_workers=4)
+    assert not collector.can_batch
+
+    circuits = [
+        cirq.Circuit([cirq.H(cirq.LineQubit(0))] * depth)
+        for depth in range(1, 11)
+    ]
+    results = collector.run(circuits, force_run_all=force_run_all)
+
+    assert results == [executor_serial_unique(c) for c in circuits]
+    assert collector.calls_to_executor == len(circuits)
+    assert collector.executed_circuits == circuits
+
+
 @pytest.mark.parametrize(
     "execute", [executor_serial_unique, executor_batched_unique]
 )
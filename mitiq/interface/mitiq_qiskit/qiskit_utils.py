@@ -121,7 +121,7 @@ def execute_with_noise(
     job = backend.run(exec_circuit, shots=1)
     rho = job.result().data()["density_matrix"]
 
-    expectation = np.real(np.trace(rho @ obs))
+    expectation = np.real(np.einsum("ij,ji->", rho, obs))
     return expectation
 
 
@@ -218,7 +218,7 @@ class Observable:
             ).reshape(observable_matrix.shape)
 
         return np.real_if_close(
-            np.trace(density_matrix @ observable_matrix)
+            np.einsum("ij,ji->", density_matrix, observable_matrix)
         ).item()
 
     def __str__(self) -> str:
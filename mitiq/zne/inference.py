@@ -7,7 +7,8 @@
 
 import warnings
 from abc import ABC, abstractmethod
-from copy import deepcopy
+from functools import lru_cache
+from itertools import groupby
 from typing import (
     Any,
     Callable,
@@ -105,6 +106,8 @@ def mitiq_curve_fit(
     scale_factors: Sequence[float],
     exp_values: Sequence[float],
     init_params: Optional[List[float]] = None,
+    jac: Optional[Callable[..., npt.NDArray[np.float64]]] = None,
+    tol: Optional[float] = None,
 ) -> Tuple[List[float], npt.NDArray[np.float64]]:
     """Fits the ansatz to the (scale factor, expectation value) data using
     ``scipy.optimize.curve_fit``, returning the optimal parameters and
@@ -118,6 +121,17 @@ def mitiq_curve_fit(
         exp_values: The array of expectation values.
         init_params: Initial guess for the parameters. If None, the initial
             values are set to 1.
+        jac: Optional function with the same signature as the ansatz which
+            returns the Jacobian matrix of the ansatz with respect to the
+            parameters, with one row for each scale factor. If None, the
+            Jacobian is estimated numerically.
+        tol: Optional tolerance used for the relative changes of the cost
+            function and of the parameters, and for the gradient, as
+            termination conditions of the fit. Values larger than the
+            ``scipy`` default (1e-8) can reduce the number of iterations,
+            e.g., when the expectation values are affected by a much larger
+            statistical noise, at the cost of a less accurate fit. If None,
+            the ``scipy`` defaults are used.
 
     Returns:
         The array of optimal parameters and the covariance matrix of the
@@ -128,10 +142,16 @@ def mitiq_curve_fit(
         ExtrapolationError: If the extrapolation fit fails.
         ExtrapolationWarning: If the extrapolation fit is ill-conditioned.
     """
+    tol_kwargs = {} if tol is None else {"ftol": tol, "xtol": tol, "gtol": tol}
     try:
         with warnings.catch_warnings(record=True) as warn_list:
             opt_params, params_cov = curve_fit(
-                ansatz, scale_factors, exp_values, p0=init_params
+                ansatz,
+                scale_factors,
+                exp_values,
+                p0=init_params,
+                jac=jac,
+                **tol_kwargs,
             )
         for warn in warn_list:
             # replace OptimizeWarning with ExtrapolationWarning
@@ -194,6 +214,61 @@ def mitiq_polyfit(
     return list(opt_params), params_cov
 
 
+# Largest noise amplification (sum of the absolute values of the weights) for
+# which the Richardson weights are used directly instead of a polynomial fit.
+# Up to this value, both give the same zero-noise limit to about 1e-8 relative
+# precision, far below the statistical noise amplified by the same factor.
+# Beyond it, the polynomial fit is kept because it warns about ill-conditioned
+# Vandermonde systems.
+_RICHARDSON_MAX_AMPLIFICATION = 1.0e4
+
+
+def _richardson_weights(
+    scale_factors: Sequence[float], exp_values: Sequence[float]
+) -> Optional[npt.NDArray[np.float64]]:
+    """Returns the weights of Richardson extrapolation, i.e., the Lagrange
+    basis polynomials of the scale factors evaluated at zero. The
+    zero-noise limit is the dot product of these weights with the
+    expectation values.
+
+    Args:
+        scale_factors: The array of noise scale factors.
+        exp_values: The array of expectation values to extrapolate.
+
+    Returns:
+        The array of weights, one for each scale factor. None if there are
+        no scale factors, if the expectation values are not a 1-D array with
+        one value for each scale factor, if the scale factors are not
+        distinct or if the weights amplify the noise of the expectation
+        values by more than ``_RICHARDSON_MAX_AMPLIFICATION``.
+        In these cases the data is left to the polynomial fit, which raises
+        or warns as appropriate.
+    """
+    if np.shape(exp_values) != (len(scale_factors),):
+        return None
+    return _cached_richardson_weights(tuple(scale_factors))
+
+
+@lru_cache(maxsize=32)
+def _cached_richardson_weights(
+    scale_factors: Tuple[float, ...],
+) -> Optional[npt.NDArray[np.float64]]:
+    if not scale_factors or len(set(scale_factors)) != len(scale_factors):
+        return None
+
+    nodes = np.asarray(scale_factors, dtype=float)
+    diffs = nodes[np.newaxis, :] - nodes[:, np.newaxis]
+    np.fill_diagonal(diffs, 1.0)
+    ratios = nodes[np.newaxis, :] / diffs
+    np.fill_diagonal(ratios, 1.0)
+    weights = np.prod(ratios, axis=1)
+    if np.sum(np.abs(weights)) > _RICHARDSON_MAX_AMPLIFICATION:
+        return None
+
+    weights.setflags(write=False)
+    return weights
+
+
 class Factory(ABC):
     """Abstract base class which performs the classical parts of zero-noise
     extrapolation. This minimally includes:
@@ -230,7 +305,7 @@ class Factory(ABC):
             params.get("scale_factor", 0.0) for params in self._instack
         ]
         if not scale_factors and hasattr(self, "_scale_factors"):
-            return [scale_factor for scale_factor in self._scale_factors]
+            return list(self._scale_factors)
         return scale_factors
 
     def get_expectation_values(self) -> List[float]:
@@ -415,6 +490,7 @@ class Factory(ABC):
         self._params_cov = None
         self._zne_limit = None
         self._zne_error = None
+        self._zne_curve = None
         self._already_reduced = False
         return self
 
@@ -522,6 +598,9 @@ class BatchedFactory(Factory, ABC):
             * Tuple[float]
             * numpy.ndarray
 
+        Circuits sent to a serial executor can be kept in flight concurrently
+        by passing ``mitiq.Executor(executor, max_workers=...)``.
+
         Args:
             qp: Quantum circuit to run.
             executor: A ``mitiq.Executor`` or a function which inputs a (list
@@ -552,31 +631,22 @@ class BatchedFactory(Factory, ABC):
         # Get the list of keywords associated to each circuit in "to_run".
         kwargs_list = self._get_keyword_args(num_to_average)
 
-        # If there are different keyword args, run each circuit individually.
-        # https://stackoverflow.com/questions/1151658/python-hashable-dicts.
-        class HashableDict(Dict[Any, Any]):
-            def __hash__(self) -> int:  # type: ignore[override]
-                return hash(tuple(sorted(self.items())))
-
-        if len(set(HashableDict(kwargs) for kwargs in kwargs_list)) != 1:
-            res = []
-            for circuit, kwargs in zip(to_run, kwargs_list):
-                res.extend(
-                    executor.evaluate(
-                        circuit, observable, force_run_all=True, **kwargs
-                    )
+        # Run consecutive circuits sharing the same keyword args as a single
+        # batch, e.g., all the "num_to_average" circuits of a scale factor.
+        res: List[float] = []
+        for kwargs, group in groupby(
+            zip(to_run, kwargs_list), key=lambda pair: pair[1]
+        ):
+            circuits = [circuit for circuit, _ in group]
+            res.extend(
+                executor.evaluate(
+                    circuits, observable, force_run_all=True, **kwargs
                 )
-        else:
-            # Else, run all circuits.
-            res = executor.evaluate(
-                to_run, observable, force_run_all=True, **kwargs_list[0]
             )
 
-        # Reshape "res" to have "num_to_average" columns
-        reshaped = np.array(res).reshape((-1, num_to_average))
-
-        # Average the "num_to_average" columns
-        self._outstack = np.average(reshaped, axis=1).tolist()
+        # Average the "num_to_average" results of each scale factor
+        reshaped = np.asarray(res).reshape((-1, num_to_average))
+        self._outstack = reshaped.mean(axis=1).tolist()
 
         return self
 
@@ -616,11 +686,11 @@ class BatchedFactory(Factory, ABC):
             num_to_average: Number of times to call scale_noise at each scale
                 factor.
         """
-        to_run = []
-        for scale_factor in self.get_scale_factors():
-            for _ in range(num_to_average):
-                to_run.append(scale_noise(circuit, scale_factor))
-        return to_run
+        return [
+            scale_noise(circuit, scale_factor)
+            for scale_factor in self.get_scale_factors()
+            for _ in range(num_to_average)
+        ]
 
     def _batch_populate_instack(self) -> None:
         """Populates the instack with all computed values."""
@@ -646,9 +716,14 @@ class BatchedFactory(Factory, ABC):
         Returns:
             The output list of keyword dictionaries.
         """
-        params = deepcopy(self._instack)
-        for d in params:
-            _ = d.pop("scale_factor")
+        # Read the keywords from the "shot_list" column rather than
+        # stripping "scale_factor" out of each instack dictionary.
+        if self._shot_list:
+            params: List[Dict[str, Any]] = [
+                {"shots": shots} for shots in self._shot_list
+            ]
+        else:
+            params = [{} for _ in self._scale_factors]
 
         # Repeat each keyword num_to_average times
         return [k for k in params for _ in range(num_to_average)]
@@ -705,17 +780,19 @@ class AdaptiveFactory(Factory, ABC):
         counter = 0
         while not self.is_converged() and counter < max_iterations:
             next_in_params = self.next()
-            next_exec_params = deepcopy(next_in_params)
 
-            # Get next scale factor and remove it from next_exec_params
-            scale_factor = next_exec_params.pop("scale_factor")
+            # Get next scale factor and the remaining executor parameters
+            scale_factor = next_in_params["scale_factor"]
+            next_exec_params = {
+                k: v for k, v in next_in_params.items() if k != "scale_factor"
+            }
             next_expval = scale_factor_to_expectation_value(
                 scale_factor, **next_exec_params
             )
             self.push(next_in_params, next_expval)
             counter += 1
 
-        if counter == max_iterations:
+        if not self.is_converged():
             warnings.warn(
                 "Factory iteration loop stopped before convergence. "
                 f"Maximum number of iterations ({max_iterations}) "
@@ -919,6 +996,15 @@ class RichardsonFactory(BatchedFactory):
             parameters. To compute the zero-noise limit from the Factory
             parameters, use the ``reduce`` method.
         """
+        # For distinct scale factors, the zero-noise limit is a fixed linear
+        # combination of the expectation values, so no fit is necessary.
+        # Invalid or ill-conditioned data is left to the polynomial fit
+        # below, which raises or warns about it.
+        if not full_output:
+            weights = _richardson_weights(scale_factors, exp_values)
+            if weights is not None:
+                return weights @ np.asarray(exp_values)
+
         # Richardson extrapolation is a particular case of a polynomial fit
         # with order equal to the number of data points minus 1.
         order = len(scale_factors) - 1
@@ -1356,22 +1442,28 @@ class PolyExpFactory(BatchedFactory):
         else:
             sign = np.sign(-linear_params[0])
 
+        def _exponent(x: float, z_coeffs: Sequence[float]) -> float:
+            """Returns x * z(x), where the coefficients of the polynomial z(x)
+            are given from the lowest to the highest degree. The polynomial
+            is evaluated with Horner's method, which works equally on a
+            float or on the array of all scale factors."""
+            z = 0.0
+            for coeff in reversed(z_coeffs):
+                z = z * x + coeff
+            return x * z
+
         def _ansatz_unknown(x: float, *coeffs: float) -> float:
             """Ansatz of generic order with unknown asymptote."""
-            # Coefficients of the polynomial to be exponentiated
-            z_coeffs = coeffs[2:][::-1]
-            return coeffs[0] + coeffs[1] * np.exp(x * np.polyval(z_coeffs, x))
+            return coeffs[0] + coeffs[1] * np.exp(_exponent(x, coeffs[2:]))
 
         def _ansatz_known(x: float, *coeffs: float) -> float:
             """Ansatz of generic order with known asymptote."""
-            # Coefficients of the polynomial to be exponentiated
-            z_coeffs = coeffs[1:][::-1]
-            return asymptote + coeffs[0] * np.exp(x * np.polyval(z_coeffs, x))
+            return asymptote + coeffs[0] * np.exp(_exponent(x, coeffs[1:]))
 
         # CASE 1: asymptote is None.
         if asymptote is None:
             # First guess for the parameters
-            p_zero = [0.0, sign, -1.0] + [0.0 for _ in range(order - 1)]
+            p_zero = [0.0, sign, -1.0] + [0.0] * (order - 1)
             opt_params, params_cov = mitiq_curve_fit(
                 _ansatz_unknown, scale_factors, exp_values, p_zero
             )
@@ -1404,7 +1496,7 @@ class PolyExpFactory(BatchedFactory):
         # CASE 2: asymptote is given and "avoid_log" is True
         if avoid_log:
             # First guess for the parameters
-            p_zero = [sign, -1.0] + [0.0 for _ in range(order - 1)]
+            p_zero = [sign, -1.0] + [0.0] * (order - 1)
             opt_params, params_cov = mitiq_curve_fit(
                 _ansatz_known, scale_factors, exp_values, p_zero
             )
@@ -1434,8 +1526,10 @@ class PolyExpFactory(BatchedFactory):
 
         # CASE 3: asymptote is given and "avoid_log" is False
         # Polynomial fit of z(x).
-        shifted_y = [max(sign * (y - asymptote), eps) for y in exp_values]
-        zstack = list(np.log(shifted_y))  # type: ignore
+        shifted_y = np.maximum(
+            sign * (np.asarray(exp_values) - asymptote), eps
+        )
+        zstack = np.log(shifted_y)
 
         # Get coefficients {z_j} of z(x)= z_0 + z_1*x + z_2*x**2...
         # Note: coefficients are ordered from high powers to powers of x
@@ -1445,7 +1539,7 @@ class PolyExpFactory(BatchedFactory):
             scale_factors,
             zstack,
             deg=order,
-            weights=np.sqrt(np.abs(shifted_y)),
+            weights=np.sqrt(shifted_y),
         )
         # The zero noise limit is ansatz(0)
         zne_limit = asymptote + sign * np.exp(z_coefficients[-1])
@@ -1546,6 +1640,8 @@ class AdaExpFactory(AdaptiveFactory):
         self.avoid_log = avoid_log
         self.max_scale_factor = max_scale_factor
         self.history: OptimizationHistory = []
+        # Data of the most recent fit, used to avoid repeating it in next()
+        self._fitted_data: Optional[Tuple[List[float], List[float]]] = None
 
     def next(self) -> Dict[str, float]:
         """Returns a dictionary of parameters to execute a circuit at."""
@@ -1559,13 +1655,15 @@ class AdaExpFactory(AdaptiveFactory):
         if (len(self._instack) == 2) and (self.asymptote is None):
             return {"scale_factor": 2 * self._scale_factor}
 
-        with warnings.catch_warnings():
-            # This is an intermediate fit, so we suppress its warning messages
-            warnings.simplefilter("ignore", ExtrapolationWarning)
-            # Call reduce() to fit the exponent and save it in self.history
-            self.reduce()
-            # The next line avoids warnings after intermediate extrapolations
-            self._already_reduced = False
+        # Fit again only if new data was collected since the last fit
+        if self._fitted_data != self._get_fit_data():
+            with warnings.catch_warnings():
+                # This is an intermediate fit, so we suppress its warnings
+                warnings.simplefilter("ignore", ExtrapolationWarning)
+                # Call reduce() to fit the exponent and save it in history
+                self.reduce()
+        # The next line avoids warnings after intermediate extrapolations
+        self._already_reduced = False
 
         # Get the most recent fitted parameters from self.history
         _, _, params, _ = self.history[-1]
@@ -1579,6 +1677,17 @@ class AdaExpFactory(AdaptiveFactory):
         )
         return {"scale_factor": next_scale_factor}
 
+    def reset(self) -> "AdaExpFactory":
+        """Resets the internal state of the Factory."""
+        super().reset()
+        self._fitted_data = None
+        return self
+
+    def _get_fit_data(self) -> Tuple[List[float], List[float]]:
+        """Returns a copy of the scale factors and expectation values which
+        are fitted by the ``reduce`` method."""
+        return self.get_scale_factors(), list(self.get_expectation_values())
+
     def is_converged(self) -> bool:
         """Returns True if all the needed expectation values have been
         computed, else False.
@@ -1656,6 +1765,7 @@ class AdaExpFactory(AdaptiveFactory):
         Returns:
             The zero-noise limit.
         """
+        fit_data = self._get_fit_data()
         (
             self._zne_limit,
             self._zne_error,
@@ -1663,12 +1773,12 @@ class AdaExpFactory(AdaptiveFactory):
             self._params_cov,
             self._zne_curve,
         ) = self.extrapolate(  # type: ignore [misc]
-            self.get_scale_factors(),
-            self.get_expectation_values(),
+            *fit_data,
             asymptote=self.asymptote,
             avoid_log=self.avoid_log,
             full_output=True,
         )
+        self._fitted_data = fit_data
         # Update optimization history
         self.history.append(
             (self._instack, self._outstack, self._opt_params, self._zne_limit)
@@ -6,7 +6,6 @@
 """Functions for local and global unitary folding on supported circuits."""
 
 import warnings
-from copy import deepcopy
 from typing import Any, Dict, FrozenSet, List, Optional, cast
 
 import numpy as np
@@ -153,7 +152,7 @@ def _fold_all(
                 f"Do not know how to exclude {item} of type {type(item)}."
             )
 
-    folded = deepcopy(circuit)[:0]
+    folded = circuit[:0]
     for i, moment in enumerate(circuit):
         if i in skip_moments:
             folded.append(moment, strategy=InsertStrategy.EARLIEST)
@@ -257,7 +256,7 @@ def fold_all(
         )
     _check_foldable(circuit)
 
-    folded = deepcopy(circuit)
+    folded = circuit.copy()
     measurements = _pop_measurements(folded)
 
     folded = _fold_all(folded, round((scale_factor - 1.0) / 2.0), exclude)
@@ -293,19 +292,20 @@ def fold_global(
     if not (scale_factor >= 1):
         raise ValueError("The scale factor must be a real number >= 1.")
 
-    folded = deepcopy(circuit)
+    folded = circuit.copy()
     measurements = _pop_measurements(folded)
-    base_circuit = deepcopy(folded)
+    base_circuit = folded.copy()
 
     # Determine the number of global folds and the final fractional scale
     num_global_folds, fraction_scale = divmod(scale_factor - 1, 2)
-    # Do the global folds
-    for _ in range(int(num_global_folds)):
-        folded += Circuit(inverse(base_circuit), base_circuit)
+    # Do the global folds, all sharing the same inverse of the base circuit
+    if num_global_folds > 0:
+        global_fold = Circuit(inverse(base_circuit), base_circuit)
+        folded += global_fold * int(num_global_folds)
 
     # Fold remaining gates until the scale is reached
-    operations = list(base_circuit.all_operations())
-    num_to_fold = int(round(fraction_scale * len(operations) / 2))
+    num_operations = sum(len(moment) for moment in base_circuit)
+    num_to_fold = int(round(fraction_scale * num_operations / 2))
 
     if num_to_fold > 0:
         # Create the inverse of the final partial circuit
@@ -424,13 +424,13 @@ def _create_fold_mask(
     num_uniform_folds = int((scale_factor - 1.0) / 2.0)
     odd_integer_scale_factor = 2 * num_uniform_folds + 1
 
+    # Gates with zero weight are never folded
+    is_foldable = np.logical_not(np.isclose(weight_mask, 0.0)).tolist()
+
     # Uniformly folding all gates to reach odd_integer_scale_factor
-    num_folds_mask = []
-    for w in weight_mask:
-        if np.isclose(w, 0.0):
-            num_folds_mask.append(0)
-        else:
-            num_folds_mask.append(num_uniform_folds)
+    num_folds_mask = [
+        num_uniform_folds if foldable else 0 for foldable in is_foldable
+    ]
 
     # If the scale_factor is an odd integer, we are done.
     if np.isclose(odd_integer_scale_factor, scale_factor):
@@ -445,16 +445,16 @@ def _create_fold_mask(
     # Fold gates until the input scale_factor is better approximated
     input_circuit_weight = sum(weight_mask)
     output_circuit_weight = odd_integer_scale_factor * input_circuit_weight
-    approx_error = np.abs(
+    approx_error = abs(
         output_circuit_weight - scale_factor * input_circuit_weight
     )
     for j in folding_order:
         # Skip gates with 0 weight
-        if np.isclose(weight_mask[j], 0.0):
+        if not is_foldable[j]:
             continue
         # Compute the approx error if a new fold would be applied
         new_output_circuit_weight = output_circuit_weight + 2 * weight_mask[j]
-        new_approx_error = np.abs(
+        new_approx_error = abs(
             new_output_circuit_weight - scale_factor * input_circuit_weight
         )
         # Fold the candidate gate only if it helps improving the approximation
@@ -495,10 +495,10 @@ def _apply_fold_mask(
     Returns: The folded quantum circuit.
     """
     _check_foldable(circuit)
-    circ_copy = deepcopy(circuit)
+    circ_copy = circuit.copy()
     measurements = _pop_measurements(circ_copy)
 
-    num_gates = len(list(circ_copy.all_operations()))
+    num_gates = sum(len(moment) for moment in circ_copy)
     if num_gates != len(num_folds_mask):
         raise ValueError(
             "The circuit and the folding mask have incompatible sizes."
@@ -5,7 +5,6 @@
 
 """Functions for layer-wise unitary folding on supported circuits."""
 
-from copy import deepcopy
 from typing import Callable, List
 
 import cirq
@@ -50,7 +49,7 @@ def layer_folding(
     Returns:
         The folded circuit.
     """
-    folded = deepcopy(circuit)
+    folded = circuit.copy()
     measurements = _pop_measurements(folded)
     layers = []
 
@@ -58,16 +57,12 @@ def layer_folding(
         layers.append(layer)
         # Apply the requisite number of folds to each layer.
         num_fold = layers_to_fold[i]
-        for _ in range(num_fold):
-            # We only fold the layer if it does not contain a measurement.
-            if not cirq.is_measurement(layer):
-                layers.append(Moment(inverse(layer)))
-                layers.append(Moment(layer))
-
-    # We combine each layer into a single circuit.
-    combined_circuit = cirq.Circuit()
-    for layer in layers:
-        combined_circuit.append(layer)
+        # We only fold the layer if it does not contain a measurement.
+        if num_fold > 0 and not cirq.is_measurement(layer):
+            layers.extend([Moment(inverse(layer)), layer] * num_fold)
+
+    # We combine all the layers into a single circuit at once.
+    combined_circuit = cirq.Circuit(layers)
 
     _append_measurements(combined_circuit, measurements)
     return combined_circuit
@@ -5,6 +5,8 @@
 
 """Unit tests for scaling noise by unitary folding."""
 
+from collections import Counter
+
 import numpy as np
 import pytest
 from cirq import (
@@ -44,6 +46,66 @@ from mitiq.zne.scaling.folding import (
 )
 
 
+@pytest.fixture(scope="module")
+def three_qubit_circuit():
+    """Returns the qubits and the test circuit
+
+    0: ───H───@───@───
+              │   │
+    1: ───H───X───@───
+                  │
+    2: ───H───T───X───
+
+    shared by several tests. Tests must not modify the circuit.
+    """
+    qreg = LineQubit.range(3)
+    circ = Circuit(
+        [ops.H.on_each(*qreg)],
+        [ops.CNOT.on(qreg[0], qreg[1])],
+        [ops.T.on(qreg[2])],
+        [ops.TOFFOLI.on(*qreg)],
+    )
+    return qreg, circ
+
+
+@pytest.fixture(scope="module")
+def three_qubit_circuit_with_measurements(three_qubit_circuit):
+    """Returns the qubits and the test circuit
+
+    0: ───H───@───@───M───
+              │   │
+    1: ───H───X───@───M───
+                  │
+    2: ───H───T───X───M───
+
+    shared by several tests. Tests must not modify the circuit.
+    """
+    qreg, circ = three_qubit_circuit
+    return qreg, circ + Circuit(ops.measure_each(*qreg))
+
+
+@pytest.fixture(scope="module")
+def inverse_three_qubit_circuit(three_qubit_circuit):
+    """Returns the inverse of the three_qubit_circuit."""
+    _, circ = three_qubit_circuit
+    return inverse(circ)
+
+
+@pytest.fixture(scope="module")
+def fully_folded_three_qubit_circuit(three_qubit_circuit):
+    """Returns the circuit obtained by folding every gate of the
+    three_qubit_circuit once, i.e. the expected result of local folding
+    with scale factor three. Tests must not modify the circuit.
+    """
+    qreg, _ = three_qubit_circuit
+    return Circuit(
+        [ops.H.on_each(*qreg)] * 3,
+        [ops.CNOT.on(qreg[0], qreg[1])] * 3,
+        [ops.T.on(qreg[2]), ops.T.on(qreg[2]) ** -1, ops.T.on(qreg[2])],
+        [ops.TOFFOLI.on(*qreg)] * 3,
+    )
+
+
 def test_squash_moments_two_qubits():
     """Tests squashing moments in a two-qubit circuit with 'staggered' single
     qubit gates.
@@ -122,79 +184,50 @@ def test_fold_all(scale_factor, with_measurements):
     assert _equal(folded, correct, require_qubit_equality=True)
 
 
-def test_fold_all_exclude_with_gates():
-    circuit = Circuit(
-        [ops.H(LineQubit(0))],
-        [ops.CNOT(*LineQubit.range(2))],
-        [ops.TOFFOLI(*LineQubit.range(3))],
-    )
-
-    folded = fold_all(circuit, scale_factor=3.0, exclude={ops.H})
-    correct = Circuit(
-        [ops.H(LineQubit(0))],
-        [ops.CNOT(*LineQubit.range(2))] * 3,
-        [ops.TOFFOLI(*LineQubit.range(3))] * 3,
-    )
-    assert _equal(folded, correct, require_qubit_equality=True)
-
-    folded = fold_all(circuit, scale_factor=3.0, exclude={ops.CNOT})
-    correct = Circuit(
-        [ops.H(LineQubit(0))] * 3,
-        [ops.CNOT(*LineQubit.range(2))],
-        [ops.TOFFOLI(*LineQubit.range(3))] * 3,
-    )
-    assert _equal(folded, correct, require_qubit_equality=True)
-
-    folded = fold_all(circuit, scale_factor=5.0, exclude={ops.H, ops.TOFFOLI})
-    correct = Circuit(
-        [ops.H(LineQubit(0))],
-        [ops.CNOT(*LineQubit.range(2))] * 5,
-        [ops.TOFFOLI(*LineQubit.range(3))],
-    )
-    assert _equal(folded, correct, require_qubit_equality=True)
-
-
-def test_fold_all_exclude_with_strings():
+@pytest.mark.parametrize(
+    "exclude, scale_factor, repetitions",
+    [
+        ({ops.H}, 3, (1, 3, 3)),
+        ({ops.CNOT}, 3, (3, 1, 3)),
+        ({ops.H, ops.TOFFOLI}, 5, (1, 5, 1)),
+        ({"single"}, 3, (1, 3, 3)),
+        ({"double"}, 3, (3, 1, 3)),
+        ({"single", "triple"}, 5, (1, 5, 1)),
+    ],
+)
+def test_fold_all_exclude(exclude, scale_factor, repetitions):
+    """Tests fold_all excluding gates given as Cirq gates or strings."""
     circuit = Circuit(
         [ops.H(LineQubit(0))],
         [ops.CNOT(*LineQubit.range(2))],
         [ops.TOFFOLI(*LineQubit.range(3))],
     )
-
-    folded = fold_all(circuit, scale_factor=3.0, exclude={"single"})
+    folded = fold_all(circuit, scale_factor=scale_factor, exclude=exclude)
     correct = Circuit(
-        [ops.H(LineQubit(0))],
-        [ops.CNOT(*LineQubit.range(2))] * 3,
-        [ops.TOFFOLI(*LineQubit.range(3))] * 3,
+        [ops.H(LineQubit(0))] * repetitions[0],
+        [ops.CNOT(*LineQubit.range(2))] * repetitions[1],
+        [ops.TOFFOLI(*LineQubit.range(3))] * repetitions[2],
     )
     assert _equal(folded, correct, require_qubit_equality=True)
 
-    folded = fold_all(circuit, scale_factor=3.0, exclude={"double"})
-    correct = Circuit(
-        [ops.H(LineQubit(0))] * 3,
-        [ops.CNOT(*LineQubit.range(2))],
-        [ops.TOFFOLI(*LineQubit.range(3))] * 3,
-    )
-    assert _equal(folded, correct, require_qubit_equality=True)
 
-    folded = fold_all(circuit, scale_factor=5.0, exclude={"single", "triple"})
-    correct = Circuit(
-        [ops.H(LineQubit(0))],
-        [ops.CNOT(*LineQubit.range(2))] * 5,
-        [ops.TOFFOLI(*LineQubit.range(3))],
-    )
-    assert _equal(folded, correct, require_qubit_equality=True)
-
-
-@pytest.mark.parametrize("skip", (frozenset((0, 1)), frozenset((0, 3, 7))))
-def test_fold_all_skip_moments(skip):
-    circuit = testing.random_circuit(
+@pytest.fixture(scope="module")
+def seeded_random_circuit():
+    """Returns a seeded random three-qubit circuit of H, X and CNOT gates.
+    Tests must not modify the circuit.
+    """
+    return testing.random_circuit(
         qubits=3,
         n_moments=7,
         op_density=1,
         random_state=1,
         gate_domain={ops.H: 1, ops.X: 1, ops.CNOT: 2},
     )
+
+
+@pytest.mark.parametrize("skip", (frozenset((0, 1)), frozenset((0, 3, 7))))
+def test_fold_all_skip_moments(skip, seeded_random_circuit):
+    circuit = seeded_random_circuit
     folded = _fold_all(circuit, skip_moments=skip)
 
     correct = Circuit()
@@ -276,6 +309,30 @@ def test_fold_with_channels_raises_error(fold_method):
         fold_method(circ, scale_factor=3.0)
 
 
+@pytest.mark.parametrize(
+    "fold_method",
+    [
+        fold_all,
+        fold_gates_at_random,
+        fold_global,
+    ],
+)
+def test_folding_does_not_modify_input_circuit(fold_method):
+    """Tests folding functions return new circuits and leave the input
+    circuit, including its terminal measurements, unchanged.
+    """
+    qreg = LineQubit.range(2)
+    circ = Circuit(
+        [ops.H.on(qreg[0])],
+        [ops.CNOT.on(*qreg)],
+        [ops.measure_each(*qreg)],
+    )
+    original = circ.copy()
+    folded = fold_method(circ, scale_factor=3.0)
+    assert folded is not circ
+    assert _equal(circ, original, require_qubit_equality=True)
+
+
 @pytest.mark.parametrize(
     "fold_method",
     [
@@ -353,85 +410,30 @@ def test_fold_gates_at_random_no_stretch():
     assert _equal(folded, _squash_moments(circuit))
 
 
-def test_fold_gates_at_random_seed_one_qubit():
+@pytest.mark.parametrize(
+    "scale_factor, seed, repetitions",
+    [
+        # Small scale
+        (1.4, 3, (1, 3, 1)),
+        # Medium scale, fold two gates
+        (2.5, 2, (1, 3, 3)),
+        # Max scale, fold three gates
+        (3, 3, (3, 3, 3)),
+    ],
+)
+def test_fold_gates_at_random_seed_one_qubit(scale_factor, seed, repetitions):
     """Test for folding gates at random on a one qubit circuit with a seed for
     repeated behavior.
     """
     qubit = LineQubit(0)
     circuit = Circuit([ops.X.on(qubit), ops.Y.on(qubit), ops.Z.on(qubit)])
-    # Small scale
-    folded = fold_gates_at_random(circuit, scale_factor=1.4, seed=3)
-    correct = Circuit(
-        [ops.X.on(qubit)], [ops.Y.on(qubit)] * 3, [ops.Z.on(qubit)]
-    )
-    assert _equal(folded, correct)
-
-    # Medium scale, fold two gates
-    folded = fold_gates_at_random(circuit, scale_factor=2.5, seed=2)
-    correct = Circuit(
-        [ops.X.on(qubit)],
-        [ops.Y.on(qubit)] * 3,
-        [ops.Z.on(qubit)] * 3,
-    )
-    assert _equal(folded, correct)
-
-    # Max scale, fold three gates
-    folded = fold_gates_at_random(circuit, scale_factor=3, seed=3)
-    correct = Circuit(
-        [ops.X.on(qubit)] * 3,
-        [ops.Y.on(qubit)] * 3,
-        [ops.Z.on(qubit)] * 3,
-    )
-    assert _equal(folded, correct)
-
-
-def test_fold_random_min_stretch():
-    """Tests that folding at random with min scale returns a copy of the
-    input circuit.
-    """
-    # Test circuit
-    # 0: ───H───@───@───
-    #           │   │
-    # 1: ───H───X───@───
-    #               │
-    # 2: ───H───T───X───
-    qreg = LineQubit.range(3)
-    circ = Circuit(
-        [ops.H.on_each(*qreg)],
-        [ops.CNOT.on(qreg[0], qreg[1])],
-        [ops.T.on(qreg[2])],
-        [ops.TOFFOLI.on(*qreg)],
-    )
-
-    folded = fold_gates_at_random(circ, scale_factor=1, seed=1)
-    assert _equal(folded, circ)
-    assert folded is not circ
-
-
-def test_fold_random_max_stretch():
-    """Tests that folding at random with max scale folds all gates on a
-    multi-qubit circuit.
-    """
-    # Test circuit
-    # 0: ───H───@───@───
-    #           │   │
-    # 1: ───H───X───@───
-    #               │
-    # 2: ───H───T───X───
-    qreg = LineQubit.range(3)
-    circ = Circuit(
-        [ops.H.on_each(*qreg)],
-        [ops.CNOT.on(qreg[0], qreg[1])],
-        [ops.T.on(qreg[2])],
-        [ops.TOFFOLI.on(*qreg)],
+    folded = fold_gates_at_random(
+        circuit, scale_factor=scale_factor, seed=seed
     )
-
-    folded = fold_gates_at_random(circ, scale_factor=3, seed=1)
     correct = Circuit(
-        [ops.H.on_each(*qreg)] * 3,
-        [ops.CNOT.on(qreg[0], qreg[1])] * 3,
-        [ops.T.on(qreg[2]), ops.T.on(qreg[2]) ** -1, ops.T.on(qreg[2])],
-        [ops.TOFFOLI.on(*qreg)] * 3,
+        [ops.X.on(qubit)] * repetitions[0],
+        [ops.Y.on(qubit)] * repetitions[1],
+        [ops.Z.on(qubit)] * repetitions[2],
     )
     assert _equal(folded, correct)
 
@@ -464,157 +466,46 @@ def test_fold_random_no_repeats():
         [ops.Y.on(qreg[0])],
         [ops.CZ.on(*qreg)],
     )
-    circuit_ops = set(circ.all_operations())
-
     for scale in np.linspace(1.0, 3.0, 5):
         folded = fold_gates_at_random(circ, scale_factor=scale, seed=1)
-        gates = list(folded.all_operations())
-        counts = {gate: gates.count(gate) for gate in circuit_ops}
+        counts = Counter(folded.all_operations())
         assert all(count <= 3 for count in counts.values())
 
 
-def test_fold_random_with_terminal_measurements_min_stretch():
-    """Tests folding from left with terminal measurements."""
-    # Test circuit
-    # 0: ───H───@───@───M───
-    #           │   │
-    # 1: ───H───X───@───M───
-    #               │
-    # 2: ───H───T───X───M───
-    qreg = LineQubit.range(3)
-    circ = Circuit(
-        [ops.H.on_each(*qreg)],
-        [ops.CNOT.on(qreg[0], qreg[1])],
-        [ops.T.on(qreg[2])],
-        [ops.TOFFOLI.on(*qreg)],
-        [ops.measure_each(*qreg)],
-    )
-    folded = fold_gates_at_random(circ, scale_factor=1.0)
-    correct = Circuit(
-        [ops.H.on_each(*qreg)],
-        [ops.CNOT.on(qreg[0], qreg[1])],
-        [ops.T.on(qreg[2])],
-        [ops.TOFFOLI.on(*qreg)],
-        [ops.measure_each(*qreg)],
-    )
-    assert _equal(folded, correct)
-
-
-def test_fold_random_with_terminal_measurements_max_stretch():
-    """Tests folding from left with terminal measurements."""
-    # Test circuit
-    # 0: ───H───@───@───M───
-    #           │   │
-    # 1: ───H───X───@───M───
-    #               │
-    # 2: ───H───T───X───M───
-    qreg = LineQubit.range(3)
-    circ = Circuit(
-        [ops.H.on_each(*qreg)],
-        [ops.CNOT.on(qreg[0], qreg[1])],
-        [ops.T.on(qreg[2])],
-        [ops.TOFFOLI.on(*qreg)],
-        [ops.measure_each(*qreg)],
-    )
-    folded = fold_gates_at_random(circ, scale_factor=3.0)
-    correct = Circuit(
-        [ops.H.on_each(*qreg)] * 3,
-        [ops.CNOT.on(qreg[0], qreg[1])] * 3,
-        [ops.T.on(qreg[2]), ops.T.on(qreg[2]) ** -1, ops.T.on(qreg[2])],
-        [ops.TOFFOLI.on(*qreg)] * 3,
-        [ops.measure_each(*qreg)],
-    )
-    assert _equal(folded, correct)
-
-
-def test_global_fold_min_stretch():
-    """Tests that global fold with scale = 1 is the same circuit."""
-    # Test circuit
-    # 0: ───H───@───@───
-    #           │   │
-    # 1: ───H───X───@───
-    #               │
-    # 2: ───H───T───X───
-    qreg = LineQubit.range(3)
-    circ = Circuit(
-        [ops.H.on_each(*qreg)],
-        [ops.CNOT.on(qreg[0], qreg[1])],
-        [ops.T.on(qreg[2])],
-        [ops.TOFFOLI.on(*qreg)],
-    )
-
-    folded = fold_global(circ, 1.0)
-    assert _equal(folded, circ)
-    assert folded is not circ
-
-
-def test_global_fold_min_stretch_with_terminal_measurements():
-    """Tests that global fold with scale = 1 is the same circuit."""
-    # Test circuit
-    # 0: ───H───@───@───M───
-    #           │   │
-    # 1: ───H───X───@───M───
-    #               │
-    # 2: ───H───T───X───M───
-    qreg = LineQubit.range(3)
-    circ = Circuit(
-        [ops.H.on_each(*qreg)],
-        [ops.CNOT.on(qreg[0], qreg[1])],
-        [ops.T.on(qreg[2])],
-        [ops.TOFFOLI.on(*qreg)],
-        [ops.measure_each(*qreg)],
-    )
-    folded = fold_global(circ, scale_factor=1.0)
-    assert _equal(folded, circ)
-    assert folded is not circ
-
-
-def test_global_fold_stretch_factor_of_three():
-    """Tests global folding with the scale as a factor of 3."""
-    # Test circuit
-    # 0: ───H───@───@───
-    #           │   │
-    # 1: ───H───X───@───
-    #               │
-    # 2: ───H───T───X───
-    qreg = LineQubit.range(3)
-    circ = Circuit(
-        [ops.H.on_each(*qreg)],
-        [ops.CNOT.on(qreg[0], qreg[1])],
-        [ops.T.on(qreg[2])],
-        [ops.TOFFOLI.on(*qreg)],
-    )
-    folded = fold_global(circ, scale_factor=3.0)
-    correct = Circuit(circ, inverse(circ), circ)
-    assert _equal(folded, correct)
-
-
-def test_global_fold_stretch_factor_of_three_with_terminal_measurements():
-    """Tests global folding with the scale as a factor of 3 for a circuit
-    with terminal measurements.
+@pytest.mark.parametrize("with_measurements", (False, True))
+@pytest.mark.parametrize("scale_factor", (1, 3))
+@pytest.mark.parametrize("fold_method", (fold_gates_at_random, fold_global))
+def test_fold_min_and_max_scale_factors(
+    fold_method,
+    scale_factor,
+    with_measurements,
+    three_qubit_circuit,
+    inverse_three_qubit_circuit,
+    fully_folded_three_qubit_circuit,
+):
+    """Tests folding with min and max scale factors, with and without
+    terminal measurements which must stay at the end of the circuit.
     """
-    # Test circuit
-    # 0: ───H───@───@───M───
-    #           │   │
-    # 1: ───H───X───@───M───
-    #               │
-    # 2: ───H───T───X───M───
-    qreg = LineQubit.range(3)
-    circ = Circuit(
-        [ops.H.on_each(*qreg)],
-        [ops.CNOT.on(qreg[0], qreg[1])],
-        [ops.T.on(qreg[2])],
-        [ops.TOFFOLI.on(*qreg)],
-    )
-    meas = Circuit([ops.measure_each(*qreg)])
-    folded = fold_global(circ + meas, scale_factor=3.0)
-    correct = Circuit(circ, inverse(circ), circ, meas)
+    qreg, circ = three_qubit_circuit
+    meas = Circuit([ops.measure_each(*qreg)] if with_measurements else [])
+    circ_to_fold = circ + meas
+    folded = fold_method(circ_to_fold, scale_factor=scale_factor)
+    assert folded is not circ_to_fold
+
+    if scale_factor == 1:
+        correct = circ_to_fold
+    elif fold_method is fold_global:
+        correct = Circuit(circ, inverse_three_qubit_circuit, circ, meas)
+    else:
+        correct = fully_folded_three_qubit_circuit + meas
     assert _equal(folded, correct)
     # Test the number of moments too
     assert len(folded) == len(correct)
 
 
-def test_global_fold_stretch_factor_nine_with_terminal_measurements():
+def test_global_fold_stretch_factor_nine_with_terminal_measurements(
+    three_qubit_circuit, inverse_three_qubit_circuit
+):
     """Tests global folding with the scale as a factor of 9 for a circuit
     with terminal measurements.
     """
@@ -624,20 +515,16 @@ def test_global_fold_stretch_factor_nine_with_terminal_measurements():
     # 1: ───H───X───@───M───
     #               │
     # 2: ───H───T───X───M───
-    qreg = LineQubit.range(3)
-    circ = Circuit(
-        [ops.H.on_each(*qreg)],
-        [ops.CNOT.on(qreg[0], qreg[1])],
-        [ops.T.on(qreg[2])],
-        [ops.TOFFOLI.on(*qreg)],
-    )
+    qreg, circ = three_qubit_circuit
     meas = Circuit([ops.measure_each(*qreg)])
     folded = fold_global(circ + meas, scale_factor=9.0)
-    correct = Circuit([circ, inverse(circ)] * 4, [circ], [meas])
+    correct = circ + (inverse_three_qubit_circuit + circ) * 4 + meas
     assert _equal(folded, correct)
 
 
-def test_global_fold_stretch_factor_eight_terminal_measurements():
+def test_global_fold_stretch_factor_eight_terminal_measurements(
+    three_qubit_circuit, inverse_three_qubit_circuit
+):
     """Tests global folding with a scale factor not a multiple of three so
     that local folding is also called.
     """
@@ -647,29 +534,13 @@ def test_global_fold_stretch_factor_eight_terminal_measurements():
     # 1: ───H───X───@───M───
     #               │
     # 2: ───H───T───X───M───
-    qreg = LineQubit.range(3)
-    circ = Circuit(
-        [ops.H.on_each(*qreg)],
-        [ops.CNOT.on(qreg[0], qreg[1])],
-        [ops.T.on(qreg[2])],
-        [ops.TOFFOLI.on(*qreg)],
-    )
+    qreg, circ = three_qubit_circuit
     meas = Circuit(ops.measure_each(*qreg))
     folded = fold_global(circ + meas, scale_factor=3.5)
-    correct = Circuit(
-        circ,
-        inverse(circ),
-        circ,
-        inverse(
-            Circuit(
-                [ops.T.on(qreg[2])],
-                [ops.TOFFOLI.on(*qreg)],
-            )
-        ),
-        [ops.T.on(qreg[2])],
-        [ops.TOFFOLI.on(*qreg)],
-        meas,
-    )
+    # The T and TOFFOLI gates are folded after the global fold
+    partial = Circuit([ops.T.on(qreg[2])], [ops.TOFFOLI.on(*qreg)])
+    correct = circ + inverse_three_qubit_circuit + circ
+    correct += inverse(partial) + partial + meas
     assert _equal(folded, correct)
 
 
@@ -741,16 +612,17 @@ def test_global_fold_moment_structure_maintained_partial_scale_factors():
 
     for i in range(1, 4):
         circuit1 += Circuit(gate_list1[i](qreg[i]))
+    inverse1 = inverse(circuit1)
     folded1 = fold_global(circuit1, scale_factor=1.5)
-    correct1 = Circuit(circuit1, inverse(circuit1)[0], circuit1[-1])
+    correct1 = Circuit(circuit1, inverse1[0], circuit1[-1])
     assert _equal(folded1, correct1)
 
     folded2 = fold_global(circuit1, scale_factor=2.5)
-    correct2 = Circuit(circuit1, inverse(circuit1)[0:3], circuit1[1:])
+    correct2 = Circuit(circuit1, inverse1[0:3], circuit1[1:])
     assert _equal(folded2, correct2)
 
     folded3 = fold_global(circuit1, scale_factor=2.75)
-    correct3 = Circuit(circuit1, inverse(circuit1), circuit1)
+    correct3 = Circuit(circuit1, inverse1, circuit1)
     assert _equal(folded3, correct3)
 
 
@@ -915,34 +787,19 @@ def test_fold_global_with_qiskit_circuits_and_idle_qubits():
     assert folded_qiskit_circuit.cregs == qiskit_circuit.cregs
 
 
-def test_fold_left_squash_moments():
+def test_fold_left_squash_moments(
+    three_qubit_circuit_with_measurements, fully_folded_three_qubit_circuit
+):
     """Tests folding from left with kwarg squash_moments."""
-    # Test circuit
-    # 0: ───H───@───@───M───
-    #           │   │
-    # 1: ───H───X───@───M───
-    #               │
-    # 2: ───H───T───X───M───
-    qreg = LineQubit.range(3)
-    circ = Circuit(
-        [ops.H.on_each(*qreg)],
-        [ops.CNOT.on(qreg[0], qreg[1])],
-        [ops.T.on(qreg[2])],
-        [ops.TOFFOLI.on(*qreg)],
-        [ops.measure_each(*qreg)],
-    )
+    qreg, circ = three_qubit_circuit_with_measurements
     folded_not_squashed = fold_gates_at_random(
         circ, scale_factor=3, squash_moments=False
     )
     folded_and_squashed = fold_gates_at_random(
         circ, scale_factor=3, squash_moments=True
     )
-    correct = Circuit(
-        [ops.H.on_each(*qreg)] * 3,
-        [ops.CNOT.on(qreg[0], qreg[1])] * 3,
-        [ops.T.on(qreg[2]), ops.T.on(qreg[2]) ** -1, ops.T.on(qreg[2])],
-        [ops.TOFFOLI.on(*qreg)] * 3,
-        [ops.measure_each(*qreg)],
+    correct = fully_folded_three_qubit_circuit + Circuit(
+        ops.measure_each(*qreg)
     )
     assert _equal(folded_and_squashed, folded_not_squashed)
     assert _equal(folded_and_squashed, correct)
@@ -1076,7 +933,9 @@ def test_fold_local_with_single_qubit_gates_fidelity_one(qiskit):
 
 
 @pytest.mark.parametrize("qiskit", [True, False])
-def test_all_gates_folded_at_max_scale_with_fidelities(qiskit):
+def test_all_gates_folded_at_max_scale_with_fidelities(
+    qiskit, fully_folded_three_qubit_circuit
+):
     """Tests that all gates are folded regardless of the input fidelities when
     the scale factor is three.
     """
@@ -1089,7 +948,7 @@ def test_all_gates_folded_at_max_scale_with_fidelities(qiskit):
         ops.T.on(qreg[2]),
         ops.TOFFOLI.on(*qreg),
     )
-    ngates = len(list(circ.all_operations()))
+    ngates = sum(len(moment) for moment in circ)
 
     if qiskit:
         circ = convert_from_mitiq(circ, "qiskit")
@@ -1104,12 +963,7 @@ def test_all_gates_folded_at_max_scale_with_fidelities(qiskit):
             "TOFFOLI": rng.rand(),
         },
     )
-    correct = Circuit(
-        [ops.H.on_each(*qreg)] * 3,
-        [ops.CNOT.on(qreg[0], qreg[1])] * 3,
-        [ops.T.on(qreg[2]), ops.T.on(qreg[2]) ** -1, ops.T.on(qreg[2])],
-        [ops.TOFFOLI.on(*qreg)] * 3,
-    )
+    correct = fully_folded_three_qubit_circuit
     if qiskit:
         assert folded.qregs == circ.qregs
         assert folded.cregs == circ.cregs
@@ -1117,7 +971,7 @@ def test_all_gates_folded_at_max_scale_with_fidelities(qiskit):
         assert equal_up_to_global_phase(folded.unitary(), correct.unitary())
     else:
         assert _equal(folded, correct)
-        assert len(list(folded.all_operations())) == 3 * ngates
+        assert sum(len(moment) for moment in folded) == 3 * ngates
 
 
 def test_fold_local_raises_error_with_bad_fidelities():
@@ -1137,10 +991,20 @@ def test_fold_local_raises_error_with_bad_fidelities():
         )
 
 
-@pytest.mark.parametrize("conversion_type", ("qiskit", "pyquil"))
-def test_convert_from_mitiq_circuit_conversion_error(conversion_type):
+@pytest.fixture(scope="module")
+def noisy_random_circuit():
+    """Returns a random five-qubit circuit with depolarizing channels, which
+    cannot be converted to other frontends.
+    """
     circuit = testing.random_circuit(qubits=5, n_moments=5, op_density=0.99)
-    noisy = circuit.with_noise(ops.depolarize(p=0.1))
+    return circuit.with_noise(ops.depolarize(p=0.1))
+
+
+@pytest.mark.parametrize("conversion_type", ("qiskit", "pyquil"))
+def test_convert_from_mitiq_circuit_conversion_error(
+    conversion_type, noisy_random_circuit
+):
+    noisy = noisy_random_circuit
 
     with pytest.raises(
         CircuitConversionError, match="Circuit could not be converted from"
@@ -1283,21 +1147,10 @@ def test_create_fold_mask_approximates_well():
         assert np.isclose(scale_factor / actual_scale, 1.0, atol=0.01)
 
 
-def test_apply_fold_mask():
-    # Test circuit
-    # 0: ───H───@───@───M───
-    #           │   │
-    # 1: ───H───X───@───M───
-    #               │
-    # 2: ───H───T───X───M───
-    qreg = LineQubit.range(3)
-    circ = Circuit(
-        [ops.H.on_each(*qreg)],
-        [ops.CNOT.on(qreg[0], qreg[1])],
-        [ops.T.on(qreg[2])],
-        [ops.TOFFOLI.on(*qreg)],
-        [ops.measure_each(*qreg)],
-    )
+def test_apply_fold_mask(
+    three_qubit_circuit_with_measurements, fully_folded_three_qubit_circuit
+):
+    qreg, circ = three_qubit_circuit_with_measurements
 
     folded = _apply_fold_mask(circ, [0, 0, 0, 0, 0, 0])
     assert _equal(folded, circ)
@@ -1319,12 +1172,8 @@ def test_apply_fold_mask():
     assert _equal(folded, _squash_moments(correct))
 
     folded = _apply_fold_mask(circ, [1, 1, 1, 1, 1, 1])
-    correct = Circuit(
-        [ops.H.on_each(*qreg)] * 3,
-        [ops.CNOT.on(qreg[0], qreg[1])] * 3,
-        [ops.T.on(qreg[2]), inverse(ops.T.on(qreg[2])), ops.T.on(qreg[2])],
-        [ops.TOFFOLI.on(*qreg)] * 3,
-        [ops.measure_each(*qreg)],
+    correct = fully_folded_three_qubit_circuit + Circuit(
+        ops.measure_each(*qreg)
     )
     assert _equal(folded, correct)
 
@@ -1345,12 +1194,13 @@ def test_apply_fold_mask_with_squash_moments_option():
     circ = Circuit(
         [ops.T.on_each(*q), ops.H(q[1])],
     )
+    fold_t0 = [inverse(ops.T(q[0])), ops.T(q[0])]
     folded = _apply_fold_mask(circ, [1, 0, 0], squash_moments=False)
     # 0: ───T───T^-1───T───────
     #
     # 1: ───T──────────────H───
     correct = Circuit(
-        [ops.T.on_each(*q), inverse(ops.T(q[0])), ops.T(q[0])],
+        [ops.T.on_each(*q), fold_t0],
     ) + Circuit(ops.H(q[1]))
     assert _equal(folded, correct)
 
@@ -1375,7 +1225,7 @@ def test_apply_fold_mask_with_squash_moments_option():
     #
     # 1: ───T───H──────────
     correct = Circuit(
-        [ops.T.on_each(*q), inverse(ops.T(q[0])), ops.T(q[0]), ops.H(q[1])],
+        [ops.T.on_each(*q), fold_t0, ops.H(q[1])],
     )
     assert _equal(folded, correct)
 
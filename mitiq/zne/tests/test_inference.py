@@ -7,17 +7,19 @@
 classically generated data.
 """
 
-from typing import Callable, List
+import math
+import warnings
+from functools import lru_cache
+from typing import Callable, Dict, List, Sequence, Tuple, Union
 
 import cirq
 import numpy as np
 from cirq import H, LineQubit, X
 from numpy.random import RandomState
-from pytest import mark, raises, warns
+from pytest import fixture, mark, raises, warns
 
 from mitiq.zne.inference import (
     AdaExpFactory,
-    AdaptiveFactory,
     ConvergenceWarning,
     ExpFactory,
     ExtrapolationError,
@@ -27,6 +29,9 @@ from mitiq.zne.inference import (
     PolyExpFactory,
     PolyFactory,
     RichardsonFactory,
+    _richardson_weights,
+    mitiq_curve_fit,
+    mitiq_polyfit,
 )
 
 # Constant parameters for test functions:
@@ -57,58 +62,85 @@ def apply_seed_to_func(func: Callable, seed: int) -> Callable:
     using a random state and returns the seeded function."""
     rnd_state = RandomState(seed)
 
-    def seeded_func(x: float, err: float = STAT_NOISE) -> float:
+    def seeded_func(
+        x: Union[float, np.ndarray], err: float = STAT_NOISE
+    ) -> Union[float, np.ndarray]:
         return func(x, err=err, rnd_state=rnd_state)
 
     return seeded_func
 
 
-# Classical test functions with statistical error:
+# Classical test functions with statistical error. They accept either a
+# single scale factor or an array of scale factors.
 def f_lin(
-    x: float, err: float = STAT_NOISE, rnd_state: RandomState = np.random
-) -> float:
+    x: Union[float, np.ndarray],
+    err: float = STAT_NOISE,
+    rnd_state: RandomState = np.random,
+) -> Union[float, np.ndarray]:
     """Linear function."""
-    return A + B * x + rnd_state.normal(scale=err)
+    return A + B * x + rnd_state.normal(scale=err, size=np.shape(x))
 
 
 def f_non_lin(
-    x: float, err: float = STAT_NOISE, rnd_state: RandomState = np.random
-) -> float:
+    x: Union[float, np.ndarray],
+    err: float = STAT_NOISE,
+    rnd_state: RandomState = np.random,
+) -> Union[float, np.ndarray]:
     """Non-linear function."""
-    return A + B * x + C * x**2 + rnd_state.normal(scale=err)
+    return A + x * (B + C * x) + rnd_state.normal(scale=err, size=np.shape(x))
 
 
 def f_exp_down(
-    x: float, err: float = STAT_NOISE, rnd_state: RandomState = np.random
-) -> float:
+    x: Union[float, np.ndarray],
+    err: float = STAT_NOISE,
+    rnd_state: RandomState = np.random,
+) -> Union[float, np.ndarray]:
     """Exponential decay."""
-    return A + B * np.exp(-C * x) + rnd_state.normal(scale=err)
+    return (
+        A + B * np.exp(-C * x) + rnd_state.normal(scale=err, size=np.shape(x))
+    )
 
 
 def f_exp_up(
-    x: float, err: float = STAT_NOISE, rnd_state: RandomState = np.random
-) -> float:
+    x: Union[float, np.ndarray],
+    err: float = STAT_NOISE,
+    rnd_state: RandomState = np.random,
+) -> Union[float, np.ndarray]:
     """Exponential growth."""
-    return A - B * np.exp(-C * x) + rnd_state.normal(scale=err)
+    return (
+        A - B * np.exp(-C * x) + rnd_state.normal(scale=err, size=np.shape(x))
+    )
 
 
 def f_poly_exp_down(
-    x: float, err: float = STAT_NOISE, rnd_state: RandomState = np.random
-) -> float:
+    x: Union[float, np.ndarray],
+    err: float = STAT_NOISE,
+    rnd_state: RandomState = np.random,
+) -> Union[float, np.ndarray]:
     """Poly-exponential decay."""
-    return A + B * np.exp(-C * x - D * x**2) + rnd_state.normal(scale=err)
+    return (
+        A
+        + B * np.exp(-x * (C + D * x))
+        + rnd_state.normal(scale=err, size=np.shape(x))
+    )
 
 
 def f_poly_exp_up(
-    x: float, err: float = STAT_NOISE, rnd_state: RandomState = np.random
-) -> float:
+    x: Union[float, np.ndarray],
+    err: float = STAT_NOISE,
+    rnd_state: RandomState = np.random,
+) -> Union[float, np.ndarray]:
     """Poly-exponential growth."""
-    return A - B * np.exp(-C * x - D * x**2) + rnd_state.normal(scale=err)
+    return (
+        A
+        - B * np.exp(-x * (C + D * x))
+        + rnd_state.normal(scale=err, size=np.shape(x))
+    )
 
 
 def f_lin_shot(x: float, shots=1) -> float:
     """Linear function with "shots" argument."""
-    return A + B * x + 0.001 / np.sqrt(shots)
+    return A + B * x + 0.001 / math.sqrt(shots)
 
 
 def f_runge(x: float) -> float:
@@ -118,6 +150,95 @@ def f_runge(x: float) -> float:
     return 1.0 / ((x - 2) ** 2 + 1.0)
 
 
+# Exact zero-noise limits of the test functions above
+ZERO_NOISE_LIMITS = {
+    f_lin: A,
+    f_non_lin: A,
+    f_exp_down: A + B,
+    f_exp_up: A - B,
+    f_poly_exp_down: A + B,
+    f_poly_exp_up: A - B,
+    f_lin_shot: A + 0.001,
+}
+
+
+@lru_cache(maxsize=8)
+def _cached_vander(scale_factors: Tuple[float, ...], order: int) -> np.ndarray:
+    """Read-only Vandermonde matrix of the given scale factors for a
+    polynomial of the given order (highest power first).
+    """
+    vander = np.vander(scale_factors, order + 1)
+    vander.flags.writeable = False
+    return vander
+
+
+def _vander(scale_factors: Sequence[float], order: int) -> np.ndarray:
+    return _cached_vander(tuple(scale_factors), order)
+
+
+# Richardson extrapolation at X_VALS is a fixed linear combination of the
+# samples: these weights evaluate the interpolating polynomial at zero.
+RICHARDSON_WEIGHTS = np.linalg.solve(
+    _vander(X_VALS, len(X_VALS) - 1), np.eye(len(X_VALS))
+)[-1]
+
+
+def _fast_exp_reduce(
+    scale_factors: List[float],
+    exp_values: List[float],
+    asymptote: float,
+    order: int,
+) -> float:
+    """Zero-noise limit of an (almost) exponential ansatz with known
+    asymptote, evaluated with a plain linear least squares fit of
+    log|y - asymptote|. Used as a reference for the factory results.
+    """
+    shifted_y = np.asarray(exp_values) - asymptote
+    zstack = np.log(np.abs(shifted_y))
+    z_coeffs = np.linalg.lstsq(
+        _vander(scale_factors, order), zstack, rcond=None
+    )[0]
+    return asymptote + np.sign(shifted_y[0]) * np.exp(z_coeffs[-1])
+
+
+def _poly_reduce_at_zero(
+    scale_factors: List[float], exp_values: List[float], order: int
+) -> float:
+    """Zero-noise limit of a polynomial fit, i.e. its constant term."""
+    return np.polyfit(scale_factors, exp_values, order)[-1]
+
+
+@fixture(scope="module")
+def seeded_samples() -> Callable[[Callable], Callable[[float], float]]:
+    """Returns a function which maps a test function to a lookup of its
+    seeded samples at X_VALS. Samples are computed once per test function
+    and shared by all the tests which run factories at X_VALS.
+    """
+    samples: Dict[Callable, Dict[float, float]] = {}
+
+    def get_seeded_samples(test_f: Callable) -> Callable[[float], float]:
+        if test_f not in samples:
+            seeded_f = apply_seed_to_func(test_f, SEED)
+            samples[test_f] = dict(zip(X_VALS, seeded_f(np.array(X_VALS))))
+        return samples[test_f].__getitem__
+
+    return get_seeded_samples
+
+
+@fixture(scope="module")
+def richardson_factory() -> RichardsonFactory:
+    """RichardsonFactory at X_VALS shared by the tests of this module. Tests
+    must call ``reset`` before using it."""
+    return RichardsonFactory(scale_factors=X_VALS)
+
+
+@fixture(scope="module")
+def linear_factory() -> LinearFactory:
+    """LinearFactory at X_VALS shared by the tests of this module. Tests
+    must call ``reset`` before using it."""
+    return LinearFactory(X_VALS)
+
+
 @mark.parametrize("test_f", [f_lin, f_non_lin])
 def test_noise_seeding(test_f: Callable[[float], float]):
     """Check that seeding works as expected."""
@@ -130,35 +251,67 @@ def test_noise_seeding(test_f: Callable[[float], float]):
     assert noise_a == noise_c
 
 
-@mark.parametrize(
-    "factory",
-    (
+STATIC_SCALE_FACTORS = np.linspace(1.0, 10.0, num=20)
+STATIC_SCALE_FACTORS.setflags(write=False)
+
+
+def _make_static_factory(factory):
+    """Returns a static factory at ``STATIC_SCALE_FACTORS``."""
+    if factory is PolyFactory or factory is PolyExpFactory:
+        return factory(scale_factors=STATIC_SCALE_FACTORS, order=2)
+    return factory(scale_factors=STATIC_SCALE_FACTORS)
+
+
+@fixture(
+    scope="module",
+    params=[
         LinearFactory,
         RichardsonFactory,
         FakeNodesFactory,
         PolyFactory,
         ExpFactory,
         PolyExpFactory,
-    ),
+    ],
 )
-def test_get_scale_factors_static_factories(factory):
-    scale_factors = np.linspace(1.0, 10.0, num=20)
-    if factory is PolyFactory or factory is PolyExpFactory:
-        fac = factory(scale_factors=scale_factors, order=2)
-    else:
-        fac = factory(scale_factors=scale_factors)
+def static_factory_run(request):
+    """Returns a static factory class and an instance of it which has been
+    run once on a seeded linear function, shared by the tests which only
+    read the collected data."""
+    fac = _make_static_factory(request.param)
+    fac.run_classical(apply_seed_to_func(f_lin, seed=1))
+    return request.param, fac
+
+
+def test_get_scale_factors_static_factories(static_factory_run):
+    factory, fac = static_factory_run
 
     # Expectation values haven't been computed at any scale factors yet
-    if isinstance(fac, AdaptiveFactory):
-        assert not fac.get_scale_factors()
-    else:
-        assert isinstance(fac.get_scale_factors(), list)
-        assert np.allclose(fac.get_scale_factors(), scale_factors)
+    new_fac = _make_static_factory(factory)
+    assert isinstance(new_fac.get_scale_factors(), list)
+    assert np.allclose(new_fac.get_scale_factors(), STATIC_SCALE_FACTORS)
 
-    # Compute expectation values at all the scale factors
-    fac.run_classical(apply_seed_to_func(f_lin, seed=1))
+    # Expectation values have been computed at all the scale factors
     assert isinstance(fac.get_scale_factors(), list)
-    assert np.allclose(fac.get_scale_factors(), scale_factors)
+    assert np.allclose(fac.get_scale_factors(), STATIC_SCALE_FACTORS)
+
+
+# Scale factors chosen by AdaExpFactory(steps=8, scale_factor=2.0) when it
+# runs on f_exp_up seeded with seed=1, and the samples collected at them.
+ADA_EXP_SCALE_FACTORS = np.array(
+    [
+        1.0,
+        2.0,
+        4.0,
+        4.20469548,
+        4.20310693,
+        4.2054822,
+        4.2031916,
+        4.2052843,
+    ]
+)
+ADA_EXP_EXPECTATION_VALUES = apply_seed_to_func(f_exp_up, seed=1)(
+    ADA_EXP_SCALE_FACTORS
+)
 
 
 @mark.parametrize("factory", (AdaExpFactory,))
@@ -175,51 +328,25 @@ def test_get_scale_factors_adaptive_factories(factory):
     assert isinstance(fac.get_scale_factors(), list)
 
     # Given this seeded executor, the scale factors should be as follows
-    correct_scale_factors = [
-        1.0,
-        2.0,
-        4.0,
-        4.20469548,
-        4.20310693,
-        4.2054822,
-        4.2031916,
-        4.2052843,
-    ]
     assert len(fac.get_scale_factors()) == num_steps
-    assert np.allclose(fac.get_scale_factors(), correct_scale_factors)
+    assert np.allclose(fac.get_scale_factors(), ADA_EXP_SCALE_FACTORS)
 
 
-@mark.parametrize(
-    "factory",
-    (
-        LinearFactory,
-        RichardsonFactory,
-        FakeNodesFactory,
-        PolyFactory,
-        ExpFactory,
-        PolyExpFactory,
-    ),
-)
-def test_get_expectation_values_static_factories(factory):
-    scale_factors = np.linspace(1.0, 10.0, num=20)
-    executor = apply_seed_to_func(f_lin, seed=1)
-    expectation_values = [executor(scale) for scale in scale_factors]
-
-    if factory is PolyFactory or factory is PolyExpFactory:
-        fac = factory(scale_factors=scale_factors, order=2)
-    else:
-        fac = factory(scale_factors=scale_factors)
+def test_get_expectation_values_static_factories(static_factory_run):
+    factory, fac = static_factory_run
+    # The same seeded samples which have been collected by the factory
+    expectation_values = apply_seed_to_func(f_lin, seed=1)(
+        STATIC_SCALE_FACTORS
+    )
 
     # Expectation values haven't been computed at any scale factors yet
-    assert isinstance(fac.get_expectation_values(), list)
-    assert len(fac.get_expectation_values()) == 0
+    new_fac = _make_static_factory(factory)
+    assert isinstance(new_fac.get_expectation_values(), list)
+    assert len(new_fac.get_expectation_values()) == 0
 
-    # Compute expectation values at all the scale factors
-    fac.run_classical(executor)
+    # Expectation values have been computed at all the scale factors
     assert isinstance(fac.get_expectation_values(), list)
-    assert np.allclose(
-        fac.get_expectation_values(), expectation_values, atol=1e-3
-    )
+    assert np.allclose(fac.get_expectation_values(), expectation_values)
 
 
 @mark.parametrize("factory", (AdaExpFactory,))
@@ -236,23 +363,10 @@ def test_get_expectation_values_adaptive_factories(factory):
     fac.run_classical(executor)
     assert isinstance(fac.get_scale_factors(), list)
 
-    # Given this seeded executor, the scale factors should be as follows
-    correct_scale_factors = [
-        1.0,
-        2.0,
-        4.0,
-        4.20469548,
-        4.20310693,
-        4.2054822,
-        4.2031916,
-        4.2052843,
-    ]
-    correct_expectation_values = [
-        executor(scale) for scale in correct_scale_factors
-    ]
     assert len(fac.get_expectation_values()) == num_steps
+    assert np.allclose(fac.get_scale_factors(), ADA_EXP_SCALE_FACTORS)
     assert np.allclose(
-        fac.get_expectation_values(), correct_expectation_values, atol=1e-3
+        fac.get_expectation_values(), ADA_EXP_EXPECTATION_VALUES, atol=1e-3
     )
 
 
@@ -269,12 +383,7 @@ def test_get_expectation_values_adaptive_factories(factory):
 )
 @mark.parametrize("batched", (True, False))
 def test_run_sequential_and_batched(factory, batched):
-    scale_factors = np.linspace(1.0, 10.0, num=20)
-
-    if factory is PolyFactory or factory is PolyExpFactory:
-        fac = factory(scale_factors=scale_factors, order=2)
-    else:
-        fac = factory(scale_factors=scale_factors)
+    fac = _make_static_factory(factory)
 
     # Expectation values haven't been computed at any scale factors yet
     assert isinstance(fac.get_expectation_values(), list)
@@ -295,22 +404,25 @@ def test_run_sequential_and_batched(factory, batched):
 
     assert isinstance(fac.get_expectation_values(), list)
     assert np.allclose(
-        fac.get_expectation_values(), np.ones_like(scale_factors)
+        fac.get_expectation_values(), np.ones_like(STATIC_SCALE_FACTORS)
     )
 
 
 @mark.parametrize("test_f", [f_lin, f_non_lin])
-def test_richardson_extr(test_f: Callable[[float], float]):
+def test_richardson_extr(
+    test_f: Callable[[float], float], richardson_factory: RichardsonFactory
+):
     """Test of the Richardson's extrapolator."""
     seeded_f = apply_seed_to_func(test_f, SEED)
-    fac = RichardsonFactory(scale_factors=X_VALS)
+    fac = richardson_factory.reset()
     assert not fac._opt_params
     fac.run_classical(seeded_f)
     zne_value = fac.reduce()
-    assert np.isclose(zne_value, seeded_f(0, err=0), atol=CLOSE_TOL)
+    assert np.isclose(zne_value, ZERO_NOISE_LIMITS[test_f], atol=CLOSE_TOL)
     assert len(fac._opt_params) == len(X_VALS)
     assert np.isclose(fac._opt_params[-1], zne_value)
     exp_vals = fac.get_expectation_values()
+    assert np.isclose(RICHARDSON_WEIGHTS @ exp_vals, zne_value)
     assert np.isclose(fac.extrapolate(X_VALS, exp_vals), zne_value)
     assert np.isclose(
         fac.extrapolate(X_VALS, exp_vals, full_output=True)[0],
@@ -318,6 +430,63 @@ def test_richardson_extr(test_f: Callable[[float], float]):
     )
 
 
+@mark.parametrize("full_output", [True, False])
+def test_richardson_extr_empty_data(full_output):
+    """Tests that Richardson extrapolation of empty data raises an error."""
+    with raises(ValueError, match="expected deg >= 0"):
+        RichardsonFactory.extrapolate([], [], full_output=full_output)
+
+
+@mark.parametrize("full_output", [True, False])
+def test_richardson_extr_mismatched_data(full_output):
+    """Tests that Richardson extrapolation raises an error if the numbers of
+    scale factors and expectation values differ."""
+    with raises(TypeError, match="expected x and y to have same length"):
+        RichardsonFactory.extrapolate(
+            [1.0, 2.0, 3.0], [1.0, 2.0], full_output=full_output
+        )
+
+
+def test_richardson_extr_2d_data():
+    """Tests that Richardson extrapolation of 2-D expectation values returns
+    the zero-noise limit of each column."""
+    zne_limit = RichardsonFactory.extrapolate(
+        [1, 2, 3], [[1, 2], [2, 3], [3, 4]]
+    )
+    assert np.allclose(zne_limit, [0.0, 1.0])
+
+
+@mark.parametrize("num_scale_factors", [13, 14])
+def test_richardson_extr_amplification_threshold(num_scale_factors):
+    """Tests that the zero-noise limits of Richardson extrapolation from the
+    closed-form weights and from the polynomial fit are equal on both sides
+    of the amplification threshold which selects the method."""
+    scale_factors = np.arange(1.0, num_scale_factors + 1)
+    weights = _richardson_weights(scale_factors, scale_factors)
+    # 13 (14) integer scale factors amplify the noise by 8191 (16383)
+    assert (weights is None) == (num_scale_factors == 14)
+    for seed in range(3):
+        exp_values = f_exp_down(scale_factors, rnd_state=RandomState(seed))
+        zne_limit = RichardsonFactory.extrapolate(scale_factors, exp_values)
+        fit_limit, *_ = RichardsonFactory.extrapolate(
+            scale_factors, exp_values, full_output=True
+        )
+        assert np.isclose(zne_limit, fit_limit, rtol=1.0e-7, atol=0)
+
+
+def test_richardson_extr_repeated_scale_factors():
+    """Tests that Richardson extrapolation with repeated scale factors falls
+    back to an (ill-conditioned) polynomial fit."""
+    with warns(
+        ExtrapolationWarning,
+        match=r"The extrapolation fit may be ill-conditioned.",
+    ):
+        zne_value = RichardsonFactory.extrapolate([1.0, 1.0, 2.0], [1, 1, 2])
+    assert np.isclose(
+        zne_value, _poly_reduce_at_zero([1.0, 1.0, 2.0], [1, 1, 2], 2)
+    )
+
+
 def test_fake_nodes_factory():
     """Test FakeNodesFactory in a specific regime in which the fake nodes
     interpolation method works well.
@@ -345,7 +514,7 @@ def test_fake_nodes_extrapolation():
     is better than RichardsonFactory.
     Note: in many cases RichardsonFactory is better.
     """
-    y_vals = [f_runge(x) for x in UNIFORM_X]
+    y_vals = f_runge(UNIFORM_X)
     zne_runge = FakeNodesFactory.extrapolate(UNIFORM_X, y_vals)
     zne_richard = RichardsonFactory.extrapolate(UNIFORM_X, y_vals)
     abs_err_runge = np.abs(zne_runge - f_runge(0.0))
@@ -354,14 +523,14 @@ def test_fake_nodes_extrapolation():
     assert 500 * abs_err_runge < abs_err_richard
 
 
-def test_linear_extr():
+def test_linear_extr(linear_factory: LinearFactory):
     """Tests extrapolation with a LinearFactory."""
     seeded_f = apply_seed_to_func(f_lin, SEED)
-    fac = LinearFactory(X_VALS)
+    fac = linear_factory.reset()
     assert not fac._opt_params
     fac.run_classical(seeded_f)
     zne_value = fac.reduce()
-    assert np.isclose(zne_value, seeded_f(0, err=0), atol=CLOSE_TOL)
+    assert np.isclose(zne_value, A, atol=CLOSE_TOL)
     assert np.allclose(fac._opt_params, [B, A], atol=CLOSE_TOL)
     exp_vals = fac.get_expectation_values()
     assert np.isclose(fac.extrapolate(X_VALS, exp_vals), zne_value)
@@ -375,19 +544,19 @@ def test_poly_extr():
     """Test of polynomial extrapolator."""
     # test (order=1)
     fac = PolyFactory(X_VALS, order=1)
-    fac.run_classical(f_lin)
-    assert np.isclose(fac.reduce(), f_lin(0, err=0), atol=CLOSE_TOL)
+    fac.run_classical(apply_seed_to_func(f_lin, SEED))
+    assert np.isclose(fac.reduce(), A, atol=CLOSE_TOL)
     # test that, for some non-linear functions,
     # order=1 is bad while order=2 is better.
     seeded_f = apply_seed_to_func(f_non_lin, SEED)
     fac = PolyFactory(X_VALS, order=1)
     fac.run_classical(seeded_f)
-    assert not np.isclose(fac.reduce(), seeded_f(0, err=0), atol=NOT_CLOSE_TOL)
+    assert not np.isclose(fac.reduce(), A, atol=NOT_CLOSE_TOL)
     seeded_f = apply_seed_to_func(f_non_lin, SEED)
     fac = PolyFactory(X_VALS, order=2)
     fac.run_classical(seeded_f)
     zne_value = fac.reduce()
-    assert np.isclose(fac.reduce(), seeded_f(0, err=0), atol=CLOSE_TOL)
+    assert np.isclose(fac.reduce(), A, atol=CLOSE_TOL)
     exp_vals = fac.get_expectation_values()
     assert np.isclose(fac.extrapolate(X_VALS, exp_vals, order=2), zne_value)
     assert np.isclose(
@@ -407,23 +576,31 @@ def test_opt_params_poly_factory(order):
     zne_value = fac.reduce()
     assert len(fac._opt_params) == order + 1
     assert np.isclose(fac._opt_params[-1], zne_value)
+    assert np.isclose(fac.get_extrapolation_curve()(0.0), zne_value)
+    assert np.isclose(
+        _poly_reduce_at_zero(
+            fac.get_scale_factors(), fac.get_expectation_values(), order
+        ),
+        zne_value,
+    )
 
 
 @mark.parametrize("avoid_log", [False, True])
 @mark.parametrize("test_f", [f_exp_down, f_exp_up])
 def test_exp_factory_with_asympt(
-    test_f: Callable[[float], float], avoid_log: bool
+    test_f: Callable[[float], float], avoid_log: bool, seeded_samples
 ):
     """Test of exponential extrapolator."""
-    seeded_f = apply_seed_to_func(test_f, SEED)
     fac = ExpFactory(X_VALS, asymptote=A, avoid_log=avoid_log)
-    fac.run_classical(seeded_f)
+    fac.run_classical(seeded_samples(test_f))
     assert not fac._opt_params
     zne_value = fac.reduce()
-    assert np.isclose(zne_value, seeded_f(0, err=0), atol=CLOSE_TOL)
+    assert np.isclose(zne_value, ZERO_NOISE_LIMITS[test_f], atol=CLOSE_TOL)
     # There are three parameters in the exponential ansatz
     assert len(fac._opt_params) == 3
     exp_vals = fac.get_expectation_values()
+    fast_zne_value = _fast_exp_reduce(X_VALS, exp_vals, asymptote=A, order=1)
+    assert np.isclose(fast_zne_value, zne_value, atol=CLOSE_TOL)
     assert np.isclose(
         fac.extrapolate(X_VALS, exp_vals, asymptote=A, avoid_log=avoid_log),
         zne_value,
@@ -446,14 +623,15 @@ def test_exp_factory_bad_asympt():
 
 
 @mark.parametrize("test_f", [f_exp_down, f_exp_up])
-def test_exp_factory_no_asympt(test_f: Callable[[float], float]):
+def test_exp_factory_no_asympt(
+    test_f: Callable[[float], float], seeded_samples
+):
     """Test of exponential extrapolator."""
-    seeded_f = apply_seed_to_func(test_f, SEED)
     fac = ExpFactory(X_VALS, asymptote=None)
-    fac.run_classical(seeded_f)
+    fac.run_classical(seeded_samples(test_f))
     assert not fac._opt_params
     zne_value = fac.reduce()
-    assert np.isclose(zne_value, seeded_f(0, err=0), atol=CLOSE_TOL)
+    assert np.isclose(zne_value, ZERO_NOISE_LIMITS[test_f], atol=CLOSE_TOL)
     # There are three parameters in the exponential ansatz
     assert len(fac._opt_params) == 3
     exp_vals = fac.get_expectation_values()
@@ -467,50 +645,55 @@ def test_exp_factory_no_asympt(test_f: Callable[[float], float]):
 @mark.parametrize("avoid_log", [False, True])
 @mark.parametrize("test_f", [f_poly_exp_down, f_poly_exp_up])
 def test_poly_exp_factory_with_asympt(
-    test_f: Callable[[float], float], avoid_log: bool
+    test_f: Callable[[float], float], avoid_log: bool, seeded_samples
 ):
     """Test of (almost) exponential extrapolator."""
     # test that, for a non-linear exponent,
     # order=1 is bad while order=2 is better.
-    seeded_f = apply_seed_to_func(test_f, SEED)
     fac = PolyExpFactory(X_VALS, order=1, asymptote=A, avoid_log=avoid_log)
-    fac.run_classical(seeded_f)
-    assert not np.isclose(fac.reduce(), seeded_f(0, err=0), atol=NOT_CLOSE_TOL)
-    seeded_f = apply_seed_to_func(test_f, SEED)
+    fac.run_classical(seeded_samples(test_f))
+    assert not np.isclose(
+        fac.reduce(), ZERO_NOISE_LIMITS[test_f], atol=NOT_CLOSE_TOL
+    )
     fac = PolyExpFactory(X_VALS, order=2, asymptote=A, avoid_log=avoid_log)
-    fac.run_classical(seeded_f)
+    fac.run_classical(seeded_samples(test_f))
     assert not fac._opt_params
 
     zne_value = fac.reduce()
-    assert np.isclose(zne_value, seeded_f(0, err=0), atol=POLYEXP_TOL)
+    assert np.isclose(zne_value, ZERO_NOISE_LIMITS[test_f], atol=POLYEXP_TOL)
 
     # There are four parameters to fit for the PolyExpFactory of order 1
     assert len(fac._opt_params) == 4
 
-    exp_values = [test_f(x) for x in X_VALS]
-    assert np.isclose(
-        PolyExpFactory.extrapolate(
-            X_VALS, exp_values, order=2, asymptote=A, avoid_log=avoid_log
-        ),
-        zne_value,
-        atol=POLYEXP_TOL,
+    fast_zne_value = _fast_exp_reduce(
+        X_VALS, fac.get_expectation_values(), asymptote=A, order=2
+    )
+    assert np.isclose(fast_zne_value, zne_value, atol=POLYEXP_TOL)
+
+    # Independent samples of the same function
+    exp_values = apply_seed_to_func(test_f, seed=1)(np.array(X_VALS))
+    other_zne_value = PolyExpFactory.extrapolate(
+        X_VALS, exp_values, order=2, asymptote=A, avoid_log=avoid_log
     )
+    assert np.isclose(other_zne_value, zne_value, atol=POLYEXP_TOL)
 
 
 @mark.parametrize("test_f", [f_poly_exp_down, f_poly_exp_up])
-def test_poly_exp_factory_no_asympt(test_f: Callable[[float], float]):
+def test_poly_exp_factory_no_asympt(
+    test_f: Callable[[float], float], seeded_samples
+):
     """Test of (almost) exponential extrapolator."""
-    seeded_f = apply_seed_to_func(test_f, SEED)
     # test that, for a non-linear exponent,
     # order=1 is bad while order=2 is better.
     fac = PolyExpFactory(X_VALS, order=1, asymptote=None)
-    fac.run_classical(seeded_f)
-    assert not np.isclose(fac.reduce(), seeded_f(0, err=0), atol=NOT_CLOSE_TOL)
-    seeded_f = apply_seed_to_func(test_f, SEED)
+    fac.run_classical(seeded_samples(test_f))
+    assert not np.isclose(
+        fac.reduce(), ZERO_NOISE_LIMITS[test_f], atol=NOT_CLOSE_TOL
+    )
     fac = PolyExpFactory(X_VALS, order=2, asymptote=None)
-    fac.run_classical(seeded_f)
+    fac.run_classical(seeded_samples(test_f))
     zne_value = fac.reduce()
-    assert np.isclose(zne_value, seeded_f(0, err=0), atol=POLYEXP_TOL)
+    assert np.isclose(zne_value, ZERO_NOISE_LIMITS[test_f], atol=POLYEXP_TOL)
 
     exp_vals = fac.get_expectation_values()
     assert np.isclose(fac.extrapolate(X_VALS, exp_vals, order=2), zne_value)
@@ -546,15 +729,33 @@ def test_poly_exp_factory_converges_toward_asympt(
     )
 
 
-@mark.parametrize("avoid_log", [False, True])
+@mark.parametrize(
+    "steps, asymptote, avoid_log",
+    [
+        (3, A, False),
+        (3, A, True),
+        (6, A, False),
+        (6, A, True),
+        (4, None, False),
+        (8, None, False),
+    ],
+)
 @mark.parametrize("test_f", [f_exp_down, f_exp_up])
-def test_ada_exp_factory_with_asympt(
-    test_f: Callable[[float], float], avoid_log: bool
+def test_ada_exp_factory(
+    test_f: Callable[[float], float],
+    steps: int,
+    asymptote: Union[float, None],
+    avoid_log: bool,
 ):
-    """Test of the adaptive exponential extrapolator."""
+    """Test of the adaptive exponential extrapolator, with and without a
+    known asymptote.
+    """
     seeded_f = apply_seed_to_func(test_f, SEED)
     fac = AdaExpFactory(
-        steps=3, scale_factor=2.0, asymptote=A, avoid_log=avoid_log
+        steps=steps,
+        scale_factor=2.0,
+        asymptote=asymptote,
+        avoid_log=avoid_log,
     )
     # Note: run_classical calls next which calls reduce, so calling
     # fac.run_classical with an AdaExpFactory sets the optimal parameters as
@@ -562,45 +763,43 @@ def test_ada_exp_factory_with_asympt(
     # AdaExpFactory.run_classical is called.
     assert not fac._opt_params
     fac.run_classical(seeded_f)
-    assert np.isclose(fac.reduce(), seeded_f(0, err=0), atol=CLOSE_TOL)
+    assert np.isclose(fac.reduce(), ZERO_NOISE_LIMITS[test_f], atol=CLOSE_TOL)
 
     # There are three parameters to fit for the (adaptive) exponential ansatz
     assert len(fac._opt_params) == 3
 
 
-@mark.parametrize("avoid_log", [False, True])
-@mark.parametrize("test_f", [f_exp_down, f_exp_up])
-def test_ada_exp_fac_with_asympt_more_steps(
-    test_f: Callable[[float], float], avoid_log: bool
-):
-    """Test of the adaptive exponential extrapolator with more steps."""
-    seeded_f = apply_seed_to_func(test_f, SEED)
-    fac = AdaExpFactory(
-        steps=6, scale_factor=2.0, asymptote=A, avoid_log=avoid_log
-    )
-    fac.run_classical(seeded_f)
-    assert np.isclose(fac.reduce(), seeded_f(0, err=0), atol=CLOSE_TOL)
-
-
-@mark.parametrize("test_f", [f_exp_down, f_exp_up])
-def test_ada_exp_factory_no_asympt(test_f: Callable[[float], float]):
-    """Test of the adaptive exponential extrapolator."""
-    seeded_f = apply_seed_to_func(test_f, SEED)
-    fac = AdaExpFactory(steps=4, scale_factor=2.0, asymptote=None)
-    fac.run_classical(seeded_f)
-    zne_value = fac.reduce()
-    assert np.isclose(zne_value, seeded_f(0, err=0), atol=CLOSE_TOL)
-
-
-@mark.parametrize("test_f", [f_exp_down, f_exp_up])
-def test_ada_exp_factory_no_asympt_more_steps(
-    test_f: Callable[[float], float],
-):
-    """Test of the adaptive exponential extrapolator."""
-    seeded_f = apply_seed_to_func(test_f, SEED)
-    fac = AdaExpFactory(steps=8, scale_factor=2.0, asymptote=None)
-    fac.run_classical(seeded_f)
-    assert np.isclose(fac.reduce(), seeded_f(0, err=0), atol=CLOSE_TOL)
+def test_ada_exp_factory_next_reuses_fit():
+    """Test that AdaExpFactory.next() fits the data only when new data has
+    been pushed since the most recent fit."""
+    seeded_f = apply_seed_to_func(f_exp_down, SEED)
+    fac = AdaExpFactory(steps=5, asymptote=A)
+    for _ in range(2):
+        scale_factor = fac.next()["scale_factor"]
+        fac.push({"scale_factor": scale_factor}, seeded_f(scale_factor))
+    next_params = fac.next()
+    assert len(fac.history) == 1
+    assert fac.next() == next_params
+    assert len(fac.history) == 1
+
+    fac.push(next_params, seeded_f(next_params["scale_factor"]))
+    fac.next()
+    assert len(fac.history) == 2
+
+
+def test_ada_exp_factory_next_refits_after_reset():
+    """Test that AdaExpFactory.next() fits the data again after a reset,
+    even if the same data is pushed."""
+    fac = AdaExpFactory(steps=5, asymptote=A)
+    next_scale_factors = []
+    for run in range(2):
+        fac.reset()
+        fac.push({"scale_factor": 1.0}, f_exp_down(1.0, err=0))
+        fac.push({"scale_factor": 2.0}, f_exp_down(2.0, err=0))
+        next_scale_factors.append(fac.next()["scale_factor"])
+        assert len(fac.history) == run + 1
+        assert np.isclose(fac.get_zero_noise_limit(), f_exp_down(0, err=0))
+    assert np.isclose(*next_scale_factors)
 
 
 def test_ada_exp_factory_bad_arguments():
@@ -620,7 +819,7 @@ def test_ada_exp_factory_bad_arguments():
 def test_avoid_log_keyword():
     """Test that avoid_log=True and avoid_log=False give different results."""
     fac = ExpFactory(X_VALS, asymptote=A, avoid_log=False)
-    fac.run_classical(f_exp_down)
+    fac.run_classical(apply_seed_to_func(f_exp_down, SEED))
     znl_with_log = fac.reduce()
     fac._options["avoid_log"] = True
     znl_without_log = fac.reduce()
@@ -663,6 +862,136 @@ def test_too_few_points_for_polyfit_warning():
         PolyFactory.extrapolate([1.0, 2.0], [1.0, 2.0], order=2)
 
 
+def test_curve_fit_with_jacobian():
+    """Tests that fitting with an analytic Jacobian finds the same optimal
+    parameters as fitting with a numerically estimated one."""
+
+    def ansatz(x, a, b):
+        return a + b * np.exp(-x)
+
+    def jac(x, a, b):
+        return np.column_stack((np.ones_like(x), np.exp(-x)))
+
+    exp_values = ansatz(np.array(X_VALS), A, B)
+    opt_params, _ = mitiq_curve_fit(ansatz, X_VALS, exp_values)
+    jac_params, _ = mitiq_curve_fit(ansatz, X_VALS, exp_values, jac=jac)
+    assert np.allclose(opt_params, [A, B])
+    assert np.allclose(jac_params, [A, B])
+
+
+@mark.parametrize(
+    "exp_values, zne_limit",
+    [
+        (
+            [
+                -0.1645142890557309,
+                -0.17182459896685132,
+                -0.2193580467752795,
+                -0.23138747681276425,
+                -0.10586168034766952,
+            ],
+            -0.21963052198856303,
+        ),
+        (
+            [
+                0.16761826401798935,
+                0.1815542738347038,
+                0.19959836233159162,
+                0.19801406575610864,
+                0.11778926017558426,
+            ],
+            0.21637598949973835,
+        ),
+        (
+            [
+                -0.12922563791334202,
+                -0.20555201540077966,
+                -0.12643708148930985,
+                -0.13747569279582525,
+                -0.20580087019161075,
+            ],
+            -0.12326124302100538,
+        ),
+        (
+            [
+                0.3075849202326564,
+                0.12291800516502799,
+                0.20613328079947008,
+                0.28968907896270935,
+                0.2589656613781139,
+            ],
+            0.199337673683587,
+        ),
+    ],
+)
+def test_exp_factory_noisy_data_regression(exp_values, zne_limit):
+    """Tests that the exponential fit of noisy data converges to previously
+    obtained zero-noise limits."""
+    scale_factors = [1, 1.3, 1.7, 2.2, 3.0]
+    assert np.isclose(
+        ExpFactory.extrapolate(scale_factors, exp_values), zne_limit
+    )
+
+
+@mark.parametrize("tol", [None, 1.0e-4])
+def test_curve_fit_tolerance(tol):
+    """Tests fits with the default and with a loose tolerance."""
+    exp_values = f_exp_down(np.array(X_VALS), err=0)
+    opt_params, _ = mitiq_curve_fit(
+        lambda x, a, b, c: a + b * np.exp(-c * x),
+        X_VALS,
+        exp_values,
+        init_params=[0.0, 1.0, 1.0],
+        tol=tol,
+    )
+    assert np.allclose(opt_params, [A, B, C], atol=1.0e-3)
+
+
+@mark.parametrize("order", [1, 2, 3])
+def test_polyfit_matches_numpy(order):
+    """Tests that polynomial fits give exactly the parameters and covariance
+    matrix of numpy.polyfit."""
+    for seed in range(3):
+        exp_values = f_non_lin(np.array(X_VALS), rnd_state=RandomState(seed))
+        opt_params, params_cov = mitiq_polyfit(X_VALS, exp_values, order)
+        np_params, np_cov = np.polyfit(X_VALS, exp_values, order, cov=True)
+        assert np.array_equal(opt_params, np_params)
+        assert np.array_equal(params_cov, np_cov)
+        zne_limit = PolyFactory.extrapolate(X_VALS, exp_values, order)
+        assert zne_limit == np_params[-1]
+
+
+@mark.parametrize("factory", [LinearFactory, PolyFactory])
+def test_polyfit_non_finite_data(factory):
+    """Tests that non-finite expectation values give the numpy.polyfit
+    zero-noise limit."""
+    kwargs = {"order": 1} if factory is PolyFactory else {}
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        zne_limit = factory.extrapolate([1, 2, 3], [1, np.inf, 3], **kwargs)
+    assert np.isnan(zne_limit)
+
+
+@mark.parametrize(
+    "scale_factors, exp_values, msg",
+    [
+        ([], [], "expected non-empty vector for x"),
+        (X_VALS, [1.0, 2.0], "expected x and y to have same length"),
+    ],
+)
+@mark.parametrize("full_output", [True, False])
+def test_polyfit_invalid_data_errors(
+    scale_factors, exp_values, msg, full_output
+):
+    """Tests that empty or mismatched data raise the numpy.polyfit errors."""
+    with raises(TypeError, match=msg):
+        mitiq_polyfit(scale_factors, exp_values, deg=1)
+    with raises(TypeError, match=msg):
+        PolyFactory.extrapolate(
+            scale_factors, exp_values, order=1, full_output=full_output
+        )
+
+
 def test_failing_fit_error():
     """Test error handling for a failing fit."""
     fac = ExpFactory(X_VALS, asymptote=None)
@@ -697,6 +1026,37 @@ def test_failing_fit_warnings(fac):
         fac.extrapolate([1, 1, 1, 1], [1.0, 1.0, 1.0, 1.0])
 
 
+@mark.parametrize("order", [1, 2])
+def test_poly_exp_log_fit_matches_weighted_polyfit(order):
+    """Test that the linearized fit of PolyExpFactory solves the same
+    weighted least squares problem as numpy.polyfit."""
+    exp_vals = f_poly_exp_down(np.array(X_VALS), err=0)
+    shifted_y = exp_vals - A
+    expected = np.polyfit(
+        X_VALS, np.log(shifted_y), order, w=np.sqrt(shifted_y)
+    )
+    _, _, opt_params, _, _ = PolyExpFactory.extrapolate(
+        X_VALS, exp_vals, order, asymptote=A, full_output=True
+    )
+    assert np.allclose(opt_params, [A] + list(expected[::-1]))
+
+
+def test_poly_exp_log_fit_nearly_coincident_scale_factors_warning():
+    """Test that the linearized fit of PolyExpFactory warns if the scale
+    factors are nearly coincident, i.e. the fit is ill-conditioned, and
+    that the zero-noise limit remains accurate."""
+    scale_factors = np.array([1.0, 1.0 + 1.0e-15, 2.0, 2.0 + 1.0e-15])
+    exp_vals = f_poly_exp_down(scale_factors, err=0)
+    with warns(
+        ExtrapolationWarning,
+        match=r"The extrapolation fit may be ill-conditioned.",
+    ):
+        zne_limit = PolyExpFactory.extrapolate(
+            scale_factors, exp_vals, 2, asymptote=A
+        )
+    assert np.isclose(zne_limit, f_poly_exp_down(0, err=0), atol=POLYEXP_TOL)
+
+
 def test_adaptive_factory_max_iteration_warnings():
     """Test that the correct warning is raised beyond the iteration limit."""
     fac = AdaExpFactory(steps=10)
@@ -707,13 +1067,27 @@ def test_adaptive_factory_max_iteration_warnings():
         fac.run_classical(lambda scale_factor: 1.0, max_iterations=3)
 
 
+def test_adaptive_factory_converged_at_max_iterations():
+    """Test that no warning is raised if the factory converges exactly at
+    the iteration limit."""
+    fac = AdaExpFactory(steps=3, asymptote=A)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", ConvergenceWarning)
+        fac.run_classical(
+            apply_seed_to_func(f_exp_down, SEED), max_iterations=3
+        )
+    assert fac.is_converged()
+
+
 @mark.parametrize("fac_class", [LinearFactory, RichardsonFactory])
 def test_iterate_with_shot_list(fac_class):
     """Tests factories with (and without) the "shot_list" argument."""
     # first test without shot_list
     fac = fac_class(X_VALS)
     fac.run_classical(f_lin_shot)
-    assert np.isclose(fac.reduce(), f_lin_shot(0), atol=CLOSE_TOL)
+    assert np.isclose(
+        fac.reduce(), ZERO_NOISE_LIMITS[f_lin_shot], atol=CLOSE_TOL
+    )
 
     # Check instack and outstack are as expected
     SHOT_LIST = [100, 200, 300, 400, 500]
@@ -725,7 +1099,9 @@ def test_iterate_with_shot_list(fac_class):
     # Now pass an arbitrary shot_list as an argument
     fac = fac_class(X_VALS, shot_list=SHOT_LIST)
     fac.run_classical(f_lin_shot)
-    assert np.isclose(fac.reduce(), f_lin_shot(0), atol=CLOSE_TOL)
+    assert np.isclose(
+        fac.reduce(), ZERO_NOISE_LIMITS[f_lin_shot], atol=CLOSE_TOL
+    )
 
     # Check instack and outstack are as expected
     for j, shots in enumerate(SHOT_LIST):
@@ -734,6 +1110,26 @@ def test_iterate_with_shot_list(fac_class):
         assert fac._outstack[j] != f_lin_shot(X_VALS[j])
 
 
+def test_run_batches_circuits_with_same_shots():
+    """Tests that circuits sharing the same number of shots are sent to a
+    batched executor as a single job."""
+    calls = []
+
+    def executor(circuits, shots) -> List[float]:
+        calls.append((len(circuits), shots))
+        return [float(shots)] * len(circuits)
+
+    fac = LinearFactory([1.0, 2.0, 3.0], shot_list=[100, 200, 200])
+    fac.run(
+        cirq.Circuit(),
+        executor,
+        scale_noise=lambda circ, _: circ,
+        num_to_average=2,
+    )
+    assert calls == [(2, 100), (4, 200)]
+    assert fac.get_expectation_values() == [100.0, 200.0, 200.0]
+
+
 def test_shot_list_errors():
     """Tests errors related to the "shot_lists" argument."""
     with raises(IndexError, match=r"must have the same length."):
@@ -756,6 +1152,8 @@ def test_push_after_already_reduced_warning():
         fac.push({"scale_factor": 3.0}, 3.0)
     # Assert no warning is raised when .reset() is used
     fac.reset()
+    with raises(ValueError, match="Data is either ill-defined or not enough"):
+        fac.get_extrapolation_curve()
     fac.push({"scale_factor": 1.0}, 2.0)
     fac.push({"scale_factor": 2.0}, 1.0)
     assert np.isclose(3.0, fac.reduce())
@@ -989,17 +1387,14 @@ def test_map_to_fakenodes():
 )
 def test_short_circuit_warning(factory):
     """Tests a warning is raised if the input circuit has very few gates."""
-    scale_factors = np.linspace(1.0, 10.0, num=20)
 
     def executor(circuits) -> List[float]:
         return [1.0] * len(circuits)
 
-    if factory is PolyFactory or factory is PolyExpFactory:
-        fac = factory(scale_factors=scale_factors, order=2)
-    elif factory is AdaExpFactory:
+    if factory is AdaExpFactory:
         fac = factory(steps=4)
     else:
-        fac = factory(scale_factors=scale_factors)
+        fac = _make_static_factory(factory)
 
     qubit = LineQubit(0)
     circuit = cirq.Circuit(X(qubit), H(qubit), X(qubit))
@@ -70,13 +70,16 @@ npZ = np.array([[1, 0], [0, -1]])
 qreg = cirq.GridQubit.rect(2, 1)
 circ = cirq.Circuit(cirq.ops.H.on_each(*qreg), cirq.measure_each(*qreg))
 
+# Stateless simulator shared by the noisy executors below
+DENSITY_MATRIX_SIMULATOR = cirq.DensityMatrixSimulator()
+
 
 @accept_any_qprogram_as_input
 def generic_executor(circuit, noise_level: float = 0.1) -> float:
     """Executor that simulates a circuit of any type and returns
     the expectation value of the ground state projector."""
     noisy_circuit = circuit.with_noise(cirq.depolarize(p=noise_level))
-    result = cirq.DensityMatrixSimulator().simulate(noisy_circuit)
+    result = DENSITY_MATRIX_SIMULATOR.simulate(noisy_circuit)
     return result.final_density_matrix[0, 0].real
 
 